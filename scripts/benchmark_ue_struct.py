@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.parsers.game_descriptor_parser import GameDescriptorParser
+from src.parsers.ue_struct import parse_item_amounts, parse_object_paths, parse_struct
+
+DESCRIPTOR_FILE = Path(__file__).parent.parent / "Docs" / "en-US.json"
+
+def legacy_parse_recipe_items(items_str):
+    if not items_str:
+        return []
+    pattern = r'ItemClass="([^"]+)"[^A]*Amount=(\d+)'
+    return [{"item_class": item_class, "amount": int(amount)} for item_class, amount in re.findall(pattern, items_str)]
+
+def legacy_parse_produced_in(produced_in_str):
+    if not produced_in_str:
+        return []
+    buildings = []
+    for match in re.findall(r'"([^"]+Build_[^"]+)"', produced_in_str):
+        building_match = re.search(r'Build_(\w+)\.Build_\w+_C', match)
+        if building_match:
+            buildings.append(building_match.group(1))
+    return buildings
+
+def time_pass(label, func, rows, repeat):
+    best = None
+    for _ in range(repeat):
+        for cached in (parse_struct, parse_item_amounts, parse_object_paths):
+            cached.cache_clear()
+        start = time.perf_counter()
+        for ingredients, products, produced_in in rows:
+            func(ingredients, products, produced_in)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    strings = len(rows) * 3
+    print(f"   {label:<28} {best * 1000:9.2f} ms   {strings / best:12,.0f} strings/s")
+    return best
+
+def run_benchmark(descriptor_file: Path, repeat: int) -> bool:
+    print("Benchmarking UE struct parsing on the full recipe set...")
+    print("=" * 60)
+
+    parser = GameDescriptorParser(descriptor_file)
+    rows = [
+        (class_obj.get("mIngredients", ""), class_obj.get("mProduct", ""), class_obj.get("mProducedIn", ""))
+        for class_obj in parser._get_classes_of_kind("recipe")
+    ]
+    print(f"   {len(rows)} recipes, {len(rows) * 3} struct strings, best of {repeat}\n")
+
+    def legacy(ingredients, products, produced_in):
+        return legacy_parse_recipe_items(ingredients), legacy_parse_recipe_items(products), legacy_parse_produced_in(produced_in)
+
+    def item_dicts(items_str):
+        return [{"item_class": item.item_class, "amount": item.amount} for item in parse_item_amounts(items_str)]
+    
+    def current(ingredients, products, produced_in):
+        return item_dicts(ingredients), item_dicts(products), parser._parse_produced_in(produced_in)
+
+    def generic(ingredients, products, produced_in):
+        return parse_struct(ingredients), parse_struct(products), parse_struct(produced_in)
+
+    mismatches = sum(1 for row in rows if legacy(*row) != current(*row))
+
+    legacy_time = time_pass("legacy regexes", legacy, rows, repeat)
+    current_time = time_pass("ue_struct field parsers", current, rows, repeat)
+    generic_time = time_pass("ue_struct parse_struct", generic, rows, repeat)
+
+    print(f"\n   legacy/field parsers: {legacy_time / current_time:.2f}x   legacy/parse_struct: {legacy_time / generic_time:.2f}x")
+    print(f"   recipes whose parsed output differs from the legacy regexes: {mismatches}")
+    return mismatches == 0
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Compare the UE struct tokenizer with the legacy recipe regexes")
+    arg_parser.add_argument("--descriptor", type=Path, default=DESCRIPTOR_FILE)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    if not args.descriptor.exists():
+        print(f"ERROR: Descriptor file not found: {args.descriptor}")
+        sys.exit(1)
+
+    sys.exit(0 if run_benchmark(args.descriptor, args.repeat) else 1)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.parsers.game_descriptor_parser import GameDescriptorParser
+
+def format_value(value):
+    return json.dumps(value, ensure_ascii=False)
+
+def print_diff(diff, show_fields: bool):
+    if not diff:
+        print("   ✓ No differences")
+        return
+
+    for dataset, changes in diff.items():
+        print(f"\n{dataset}: +{len(changes['added'])} -{len(changes['removed'])} ~{len(changes['changed'])}")
+        for key in changes["added"]:
+            print(f"   + {key}")
+        for key in changes["removed"]:
+            print(f"   - {key}")
+        for entity in changes["changed"]:
+            print(f"   ~ {entity['key']}")
+            if not show_fields:
+                continue
+            for field, change in entity["changes"].items():
+                delta = f" ({change['delta']:+g})" if "delta" in change else ""
+                print(f"       {field}: {format_value(change['old'])} -> {format_value(change['new'])}{delta}")
+
+def diff_descriptors(base_file: Path, target_file: Path, as_json: bool, show_fields: bool) -> bool:
+    for descriptor_file in (base_file, target_file):
+        if not descriptor_file.exists():
+            print(f"ERROR: Descriptor file not found: {descriptor_file}")
+            return False
+
+    try:
+        base = GameDescriptorParser(base_file)
+        target = GameDescriptorParser(target_file)
+        base.build_dataset()
+        target.build_dataset()
+    except Exception as e:
+        print(f"ERROR: Failed to load descriptors: {e}")
+        return False
+
+    start = time.perf_counter()
+    diff = base.diff(target)
+    elapsed = time.perf_counter() - start
+
+    if as_json:
+        print(json.dumps(diff, indent=2, ensure_ascii=False))
+        return True
+
+    print(f"Comparing {base_file} -> {target_file}...")
+    print("=" * 60)
+    print_diff(diff, show_fields)
+    print(f"\nDiff computed in {elapsed * 1000:.1f} ms")
+    return True
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Report added, removed and changed entities between two game descriptors")
+    arg_parser.add_argument("base", type=Path, help="Descriptor of the version being replaced")
+    arg_parser.add_argument("target", type=Path, help="Descriptor of the new version")
+    arg_parser.add_argument("--json", action="store_true", help="Print the raw diff as JSON")
+    arg_parser.add_argument("--summary", action="store_true", help="List changed entities without field-level deltas")
+    args = arg_parser.parse_args()
+
+    sys.exit(0 if diff_descriptors(args.base, args.target, args.json, not args.summary) else 1)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.parsers.game_descriptor_parser import GameDescriptorParser
+from src.parsers.records import Record
+
+DESCRIPTOR_FILE = Path(__file__).parent.parent / "Docs" / "en-US.json"
+
+def as_dicts(value):
+    if isinstance(value, Record):
+        return {key: as_dicts(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [as_dicts(item) for item in value]
+    return value
+
+def measure(build):
+    tracemalloc.start()
+    value = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size
+
+def run_measurement(descriptor_file: Path) -> bool:
+    print("Measuring extracted dataset memory: dicts vs slotted records...")
+    print("=" * 60)
+
+    parser = GameDescriptorParser(descriptor_file)
+    dataset = parser.build_dataset()
+
+    total_dicts = 0
+    total_records = 0
+    mismatches = 0
+    for name, records in dataset.items():
+        dicts, dict_size = measure(lambda: [as_dicts(record) for record in records])
+        rebuilt, record_size = measure(lambda: [type(record)(**row) for record, row in zip(records, dicts)])
+        mismatches += sum(1 for record, row in zip(rebuilt, dicts) if as_dicts(record) != row)
+        total_dicts += dict_size
+        total_records += record_size
+        print(f"   {name:<24} {len(records):5} rows   dicts {dict_size / 1024:9.1f} KiB   records {record_size / 1024:9.1f} KiB")
+
+    print(f"\n   total: dicts {total_dicts / 1024:.1f} KiB, records {total_records / 1024:.1f} KiB "
+          f"({total_records / total_dicts:.0%} of dicts)")
+    print(f"   records whose fields differ from their dict form: {mismatches}")
+    return mismatches == 0
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Compare memory of extracted datasets as dicts and as slotted records")
+    arg_parser.add_argument("--descriptor", type=Path, default=DESCRIPTOR_FILE)
+    args = arg_parser.parse_args()
+
+    if not args.descriptor.exists():
+        print(f"ERROR: Descriptor file not found: {args.descriptor}")
+        sys.exit(1)
+
+    sys.exit(0 if run_measurement(args.descriptor) else 1)
@@ -1,14 +1,61 @@
 #!/usr/bin/env python3
 
+import copy
 import json
 import sys
+import tempfile
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.api.dependencies import load_game_data
+from src.parsers import game_descriptor_parser
+from src.parsers.descriptor_stream import detect_encoding
 from src.parsers.game_descriptor_parser import GameDescriptorParser
 
 DESCRIPTOR_FILE = Path(__file__).parent.parent / "Docs" / "en-US.json"
+PATCH_RECIPE = "Recipe_VerifyDataPatch_C"
+PATCH_PRODUCT = "((ItemClass=\"/Game/FactoryGame/Resource/Parts/VerifyDataPatch/Desc_VerifyDataPatch.Desc_VerifyDataPatch_C\",Amount=1))"
+
+def diff_with_added_recipe(parser: GameDescriptorParser) -> dict:
+    raw = DESCRIPTOR_FILE.read_bytes()
+    data = json.loads(raw.decode(detect_encoding(raw)))
+    for entry in data:
+        classes = entry.get("Classes", [])
+        if classes and classes[0].get("ClassName", "").startswith("Recipe_"):
+            added = copy.deepcopy(classes[0])
+            added.update({"ClassName": PATCH_RECIPE, "mDisplayName": "Verify Data Patch", "mProduct": PATCH_PRODUCT})
+            classes.insert(0, added)
+            break
+    else:
+        raise ValueError("No recipe block found in the descriptor")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        patched_file = Path(directory) / DESCRIPTOR_FILE.name
+        patched_file.write_text(json.dumps(data), encoding="utf-8")
+        patched = GameDescriptorParser(patched_file)
+        patched.build_dataset()
+        return parser.diff(patched)
+
+def count_worker_pools_on_cold_snapshot(workers: int) -> int:
+    pools = []
+    executor_class = game_descriptor_parser.ProcessPoolExecutor
+    
+    class CountingExecutor(executor_class):
+        def __init__(self, *args, **kwargs):
+            pools.append(args)
+            super().__init__(*args, **kwargs)
+    
+    game_descriptor_parser.ProcessPoolExecutor = CountingExecutor
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            game_data = load_game_data(DESCRIPTOR_FILE, Path(directory), streaming=False, lazy=False, workers=workers)
+            if game_data is None:
+                raise ValueError("Failed to load the descriptor with a snapshot directory")
+            game_data.parser.compile(workers)
+    finally:
+        game_descriptor_parser.ProcessPoolExecutor = executor_class
+    return len(pools)
 
 def verify_data():
     print("Verifying data extraction from game descriptors...")
@@ -167,6 +214,44 @@ def verify_data():
         print(f"   ✗ ERROR: {e}")
         all_good = False
     
+    print("\n12. Checking Description-Derived Values...")
+    try:
+        parser.build_dataset()
+        fallbacks = parser.derived_fallbacks()
+        if not fallbacks:
+            print("   ✓ All description-derived values were parsed")
+        for fallback in fallbacks:
+            print(f"   ⚠ WARNING: {fallback['class_name']} {fallback['field']} fell back to {fallback['value']} ({fallback['source']})")
+    except Exception as e:
+        print(f"   ✗ ERROR: {e}")
+        all_good = False
+    
+    print("\n13. Checking Descriptor Diff...")
+    try:
+        diff = diff_with_added_recipe(parser)
+        expected = {"recipes": {"added": [PATCH_RECIPE], "removed": [], "changed": []}}
+        if diff == expected:
+            print("   ✓ A descriptor with one added recipe diffs as exactly +1")
+        else:
+            summary = {name: f"+{len(d['added'])} -{len(d['removed'])} ~{len(d['changed'])}" for name, d in diff.items()}
+            print(f"   ✗ ERROR: Expected recipes +1 -0 ~0, got {summary}")
+            all_good = False
+    except Exception as e:
+        print(f"   ✗ ERROR: {e}")
+        all_good = False
+    
+    print("\n14. Checking Parallel Extraction With A Cold Snapshot...")
+    try:
+        pools = count_worker_pools_on_cold_snapshot(2)
+        if pools == 1:
+            print("   ✓ The snapshot build extracted the datasets with worker processes")
+        else:
+            print(f"   ✗ ERROR: Expected 1 worker pool, got {pools}")
+            all_good = False
+    except Exception as e:
+        print(f"   ✗ ERROR: {e}")
+        all_good = False
+    
     print("\n" + "=" * 60)
     if all_good:
         print("✓ All data verification passed!")
@@ -0,0 +1,235 @@
+from fastapi import Depends, FastAPI, HTTPException, Request
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import asyncio
+import itertools
+import logging
+import os
+import sys
+try:
+    import resource
+except ImportError:
+    resource = None
+from src.api.localization import negotiate_locale
+from src.api.versioning import VERSION_HEADER
+from src.parsers.game_descriptor_parser import GameDescriptorParser
+from src.parsers.localization import LocaleStrings, LocalizedParser, discover_locale_files
+from src.utils.calculations import SatisfactoryCalculator
+
+logger = logging.getLogger(__name__)
+
+DESCRIPTOR_FILE = Path(__file__).parent.parent.parent / "Docs" / "en-US.json"
+VERSIONS_DIR = Path(__file__).parent.parent.parent / "Docs" / "versions"
+DEFAULT_VERSION = os.environ.get("DEFAULT_GAME_VERSION", "default")
+OVERLAY_DIR_NAME = "mods"
+SNAPSHOT_DIR = Path(__file__).parent.parent.parent / ".cache" / "snapshots"
+STREAMING_LOAD = os.environ.get("DESCRIPTOR_STREAMING_LOAD", "").lower() in ("1", "true", "yes")
+LAZY_LOAD = os.environ.get("DESCRIPTOR_LAZY_LOAD", "").lower() in ("1", "true", "yes")
+KEEP_RAW_DESCRIPTOR = os.environ.get("DESCRIPTOR_KEEP_RAW", "").lower() in ("1", "true", "yes")
+EXTRACT_WORKERS = int(os.environ.get("DESCRIPTOR_EXTRACT_WORKERS", "0") or 0)
+WATCH_INTERVAL = float(os.environ.get("DESCRIPTOR_WATCH_INTERVAL", "0") or 0)
+RELOAD_TOKEN = os.environ.get("ADMIN_RELOAD_TOKEN")
+
+_generations = itertools.count(1)
+_reload_lock = asyncio.Lock()
+
+class GameData:
+    def __init__(
+        self,
+        parser: GameDescriptorParser,
+        generation: int = 0,
+        version: str = DEFAULT_VERSION,
+        locales: Optional[Dict[str, LocaleStrings]] = None
+    ):
+        self.parser = parser
+        self.generation = generation
+        self.version = version
+        self.calculator = SatisfactoryCalculator(parser)
+        self.default_locale = parser.descriptor_file.stem
+        self.locales = locales or {}
+        self._localized: Dict[str, Tuple[LocalizedParser, SatisfactoryCalculator]] = {}
+    
+    @property
+    def available_locales(self) -> List[str]:
+        return [self.default_locale, *self.locales]
+    
+    def _localized_data(self, locale: str) -> Optional[Tuple[LocalizedParser, SatisfactoryCalculator]]:
+        strings = self.locales.get(locale)
+        if strings is None:
+            return None
+        localized = self._localized.get(locale)
+        if localized is None:
+            parser = LocalizedParser(self.parser, strings)
+            localized = self._localized.setdefault(locale, (parser, SatisfactoryCalculator(parser)))
+        return localized
+    
+    def parser_for(self, locale: str) -> GameDescriptorParser:
+        localized = self._localized_data(locale)
+        return self.parser if localized is None else localized[0]
+    
+    def calculator_for(self, locale: str) -> SatisfactoryCalculator:
+        localized = self._localized_data(locale)
+        return self.calculator if localized is None else localized[1]
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def load_game_data(
+    descriptor_file: Path = DESCRIPTOR_FILE,
+    snapshot_dir: Optional[Path] = SNAPSHOT_DIR,
+    streaming: bool = STREAMING_LOAD,
+    lazy: bool = LAZY_LOAD,
+    version: str = DEFAULT_VERSION,
+    workers: int = 0
+) -> Optional[GameData]:
+    overlay_files = discover_overlay_files(descriptor_file)
+    if lazy and overlay_files:
+        logger.warning(f"Loading version {version} eagerly because it has descriptor overlays")
+        lazy = False
+    
+    try:
+        if lazy:
+            parser = GameDescriptorParser(descriptor_file, lazy=True)
+        else:
+            parser = GameDescriptorParser(
+                descriptor_file, snapshot_dir, streaming=streaming, overlay_files=overlay_files, workers=workers
+            )
+    except Exception as e:
+        logger.error(f"Failed to load game descriptor file for version {version}: {e}")
+        return None
+    
+    locales = load_locale_strings(parser, descriptor_file, version)
+    stats = parser.load_stats
+    peak_rss = _peak_rss_mb()
+    peak_rss_text = f"{peak_rss:.1f} MB" if peak_rss is not None else "unavailable"
+    generation = next(_generations)
+    logger.info(
+        f"Loaded game descriptor {descriptor_file.name} for version {version} (generation {generation}) from {stats['source']} "
+        f"(encoding: {stats['encoding'] or 'n/a'}) in {stats['seconds'] * 1000:.1f} ms, peak RSS {peak_rss_text}, "
+        f"locales: {', '.join([descriptor_file.stem, *locales])}, overlays: {len(parser.overlay_files)}"
+    )
+    return GameData(parser, generation, version, locales)
+
+def load_locale_strings(parser: GameDescriptorParser, descriptor_file: Path, version: str = DEFAULT_VERSION) -> Dict[str, LocaleStrings]:
+    locales = {}
+    for locale, locale_file in discover_locale_files(descriptor_file).items():
+        try:
+            locales[locale] = LocaleStrings.from_file(locale, locale_file, parser)
+        except Exception as e:
+            logger.error(f"Failed to load locale {locale} for version {version} from {locale_file}: {e}")
+    return locales
+
+def discover_overlay_files(descriptor_file: Path) -> List[Path]:
+    overlay_dir = descriptor_file.parent / OVERLAY_DIR_NAME
+    if not overlay_dir.is_dir():
+        return []
+    return sorted(path for path in overlay_dir.glob("*.json") if path.is_file())
+
+def discover_descriptor_files(descriptor_file: Path = DESCRIPTOR_FILE, versions_dir: Path = VERSIONS_DIR) -> Dict[str, Path]:
+    descriptor_files = {DEFAULT_VERSION: descriptor_file}
+    if versions_dir.is_dir():
+        for version_dir in sorted(versions_dir.iterdir()):
+            candidate = version_dir / descriptor_file.name
+            if version_dir.is_dir() and version_dir.name != DEFAULT_VERSION and candidate.exists():
+                descriptor_files[version_dir.name] = candidate
+    return descriptor_files
+
+def _share_unchanged(game_data: GameData, others: Iterable[GameData], workers: int = 0):
+    others = [other for other in others if other.version != game_data.version]
+    if not others or game_data.parser.lazy:
+        return
+    
+    game_data.parser.build_dataset(workers)
+    shared = 0
+    for other in others:
+        if not other.parser.lazy:
+            other.parser.build_dataset(workers)
+            shared += game_data.parser.share_unchanged(other.parser)
+    logger.info(f"Game version {game_data.version} shares {shared} unchanged classes and records with other loaded versions")
+
+def _compile_game_data(game_data: GameData, workers: int = 0):
+    if KEEP_RAW_DESCRIPTOR:
+        return
+    game_data.parser.compile(workers)
+
+def load_game_versions(descriptor_files: Dict[str, Path]) -> Dict[str, GameData]:
+    game_versions = {}
+    for version, descriptor_file in descriptor_files.items():
+        game_data = load_game_data(descriptor_file, version=version, workers=EXTRACT_WORKERS)
+        if game_data is None:
+            continue
+        _share_unchanged(game_data, game_versions.values(), EXTRACT_WORKERS)
+        _compile_game_data(game_data, EXTRACT_WORKERS)
+        game_versions[version] = game_data
+    return game_versions
+
+def _load_warm_game_data(descriptor_file: Path, version: str, others: Iterable[GameData]) -> Optional[GameData]:
+    game_data = load_game_data(descriptor_file, version=version)
+    if game_data is not None:
+        game_data.parser.build_dataset()
+        _share_unchanged(game_data, others)
+        _compile_game_data(game_data)
+    return game_data
+
+async def reload_game_data(app: FastAPI, version: str = DEFAULT_VERSION) -> Optional[GameData]:
+    descriptor_file = app.state.descriptor_files.get(version)
+    if descriptor_file is None:
+        return None
+    
+    async with _reload_lock:
+        game_versions = app.state.game_versions
+        game_data = await asyncio.to_thread(_load_warm_game_data, descriptor_file, version, list(game_versions.values()))
+        if game_data is None:
+            return None
+        app.state.game_versions = {**app.state.game_versions, version: game_data}
+        return game_data
+
+def _descriptor_signature(descriptor_file: Path) -> Optional[Tuple[Tuple[str, int, int], ...]]:
+    signature = []
+    try:
+        for path in (descriptor_file, *discover_overlay_files(descriptor_file)):
+            stat = path.stat()
+            signature.append((path.name, stat.st_mtime_ns, stat.st_size))
+    except OSError:
+        return None
+    return tuple(signature)
+
+async def watch_descriptors(app: FastAPI, interval: float = WATCH_INTERVAL):
+    loaded_signatures = {version: _descriptor_signature(path) for version, path in app.state.descriptor_files.items()}
+    last_seen = dict(loaded_signatures)
+    while True:
+        await asyncio.sleep(interval)
+        for version, descriptor_file in app.state.descriptor_files.items():
+            signature = _descriptor_signature(descriptor_file)
+            stable = signature == last_seen.get(version)
+            last_seen[version] = signature
+            if signature is None or signature == loaded_signatures.get(version) or not stable:
+                continue
+            
+            game_data = await reload_game_data(app, version)
+            if game_data is None:
+                logger.error(f"Reload of {descriptor_file} failed, keeping the previous dataset for version {version}")
+            loaded_signatures[version] = signature
+
+def get_game_version(request: Request) -> str:
+    return request.scope.get("game_version") or request.headers.get(VERSION_HEADER) or DEFAULT_VERSION
+
+def get_game_data(request: Request, version: str = Depends(get_game_version)) -> GameData:
+    game_data = getattr(request.app.state, "game_versions", {}).get(version)
+    if game_data is None:
+        if version not in getattr(request.app.state, "descriptor_files", {}):
+            raise HTTPException(status_code=404, detail=f"Game version '{version}' not found")
+        raise HTTPException(status_code=500, detail="Game descriptor data not available")
+    return game_data
+
+def get_locale(request: Request, game_data: GameData = Depends(get_game_data)) -> str:
+    return negotiate_locale(request.headers.get("Accept-Language"), game_data.available_locales, game_data.default_locale)
+
+def get_parser(game_data: GameData = Depends(get_game_data), locale: str = Depends(get_locale)) -> GameDescriptorParser:
+    return game_data.parser_for(locale)
+
+def get_calculator(game_data: GameData = Depends(get_game_data), locale: str = Depends(get_locale)) -> SatisfactoryCalculator:
+    return game_data.calculator_for(locale)
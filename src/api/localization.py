@@ -0,0 +1,37 @@
+from typing import Iterable, List, Optional, Tuple
+
+def parse_accept_language(header: Optional[str]) -> List[str]:
+    if not header:
+        return []
+    
+    weighted: List[Tuple[float, int, str]] = []
+    for position, part in enumerate(header.split(",")):
+        language, _, params = part.strip().partition(";")
+        language = language.strip()
+        if not language:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            weighted.append((-quality, position, language))
+    return [language for _, _, language in sorted(weighted)]
+
+def negotiate_locale(header: Optional[str], available: Iterable[str], default: str) -> str:
+    by_lower = {locale.lower(): locale for locale in available}
+    for language in parse_accept_language(header):
+        if language == "*":
+            return default
+        language = language.lower()
+        if language in by_lower:
+            return by_lower[language]
+        primary = language.split("-")[0]
+        for locale_lower, locale in by_lower.items():
+            if locale_lower == primary or locale_lower.split("-")[0] == primary:
+                return locale
+    return default
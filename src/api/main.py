@@ -1,11 +1,25 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from src.api.routers import miners, belts, resources, recipes, buildings, items, calculations, transportation, power, logistics, extractors, progression
+from src.api.dependencies import WATCH_INTERVAL, discover_descriptor_files, load_game_versions, watch_descriptors
+from src.api.versioning import GameVersionPathMiddleware
+from src.api.routers import miners, belts, resources, recipes, buildings, items, calculations, transportation, power, logistics, extractors, progression, search, admin
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.descriptor_files = discover_descriptor_files()
+    app.state.game_versions = load_game_versions(app.state.descriptor_files)
+    watcher = asyncio.create_task(watch_descriptors(app)) if WATCH_INTERVAL > 0 else None
+    yield
+    if watcher is not None:
+        watcher.cancel()
 
 app = FastAPI(
     title="Satisfactory Game Data API",
     description="REST API providing structured game data for Satisfactory factory planning tools",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -15,6 +29,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GameVersionPathMiddleware)
 
 app.include_router(miners.router, prefix="/miners", tags=["miners"])
 app.include_router(belts.router, prefix="/belts", tags=["belts"])
@@ -28,6 +43,8 @@ app.include_router(power.router, prefix="/power", tags=["power"])
 app.include_router(logistics.router, prefix="/logistics", tags=["logistics"])
 app.include_router(extractors.router, prefix="/extractors", tags=["extractors"])
 app.include_router(progression.router, prefix="/progression", tags=["progression"])
+app.include_router(search.router, prefix="/search", tags=["search"])
+app.include_router(admin.router, prefix="/admin", tags=["admin"])
 
 @app.get("/")
 async def root():
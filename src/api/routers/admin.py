@@ -0,0 +1,78 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from typing import Optional
+import asyncio
+import logging
+import secrets
+import time
+from src.models.admin import DatasetStatus, DerivedValuesReport, DescriptorDiff
+from src.api.dependencies import RELOAD_TOKEN, GameData, get_game_data, get_game_version, reload_game_data
+
+logger = logging.getLogger(__name__)
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)):
+    if not RELOAD_TOKEN or not x_admin_token or not secrets.compare_digest(x_admin_token, RELOAD_TOKEN):
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled or the admin token is invalid")
+
+router = APIRouter(dependencies=[Depends(require_admin_token)])
+
+def _dataset_status(game_data: GameData) -> DatasetStatus:
+    stats = game_data.parser.load_stats
+    return DatasetStatus(
+        version=game_data.version,
+        generation=game_data.generation,
+        descriptor_file=str(game_data.parser.descriptor_file),
+        source=stats["source"],
+        encoding=stats["encoding"],
+        load_ms=round(stats["seconds"] * 1000, 3)
+    )
+
+@router.get("/dataset", response_model=DatasetStatus)
+async def get_dataset_status(game_data: GameData = Depends(get_game_data)):
+    return _dataset_status(game_data)
+
+@router.get("/derived-values", response_model=DerivedValuesReport)
+async def get_derived_values(game_data: GameData = Depends(get_game_data)):
+    try:
+        game_data.parser.build_dataset()
+        return DerivedValuesReport(version=game_data.version, fallbacks=game_data.parser.derived_fallbacks())
+    except Exception as e:
+        logger.error(f"Error building derived value report: {e}")
+        raise HTTPException(status_code=500, detail="Failed to build derived value report")
+
+@router.get("/diff", response_model=DescriptorDiff)
+async def get_descriptor_diff(
+    request: Request,
+    base: str = Query(..., description="Game version to compare from"),
+    target: str = Depends(get_game_version)
+):
+    game_versions = getattr(request.app.state, "game_versions", {})
+    for version in (base, target):
+        if version not in game_versions:
+            raise HTTPException(status_code=404, detail=f"Game version '{version}' not found")
+    
+    try:
+        start = time.perf_counter()
+        datasets = await asyncio.to_thread(game_versions[base].parser.diff, game_versions[target].parser)
+        return DescriptorDiff(
+            base_version=base,
+            target_version=target,
+            datasets=datasets,
+            diff_ms=round((time.perf_counter() - start) * 1000, 3)
+        )
+    except Exception as e:
+        logger.error(f"Error diffing game versions {base} and {target}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to diff game descriptor data")
+
+@router.post("/reload", response_model=DatasetStatus)
+async def reload_dataset(
+    request: Request,
+    version: str = Depends(get_game_version)
+):
+    if version not in request.app.state.descriptor_files:
+        raise HTTPException(status_code=404, detail=f"Game version '{version}' not found")
+    
+    game_data = await reload_game_data(request.app, version)
+    if game_data is None:
+        logger.error("Descriptor reload failed, keeping the previous dataset")
+        raise HTTPException(status_code=500, detail="Failed to reload game descriptor data")
+    return _dataset_status(game_data)
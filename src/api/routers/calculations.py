@@ -1,32 +1,19 @@
-from fastapi import APIRouter, HTTPException, Query
-from pathlib import Path
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Optional
 import logging
-from src.parsers.game_descriptor_parser import GameDescriptorParser
 from src.utils.calculations import SatisfactoryCalculator
+from src.api.dependencies import get_calculator
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-DESCRIPTOR_FILE = Path(__file__).parent.parent.parent.parent / "Docs" / "en-US.json"
-
-try:
-    parser = GameDescriptorParser(DESCRIPTOR_FILE)
-    calculator = SatisfactoryCalculator(parser)
-except Exception as e:
-    logger.error(f"Failed to load game descriptor file: {e}")
-    parser = None
-    calculator = None
-
 @router.get("/production-rate")
 async def get_production_rate(
     recipe: str = Query(..., description="Recipe name or class name"),
     building: Optional[str] = Query(None, description="Building type (defaults to first available)"),
-    overclock: float = Query(100.0, description="Overclock percentage (100 = no overclock)", ge=1.0, le=250.0)
+    overclock: float = Query(100.0, description="Overclock percentage (100 = no overclock)", ge=1.0, le=250.0),
+    calculator: SatisfactoryCalculator = Depends(get_calculator)
 ):
-    if calculator is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     try:
         result = calculator.calculate_production_rate(recipe, building, overclock)
         if "error" in result:
@@ -43,11 +30,9 @@ async def get_buildings_needed(
     recipe: str = Query(..., description="Recipe name or class name"),
     target_rate: float = Query(..., description="Target production rate (items per minute)", gt=0),
     building: Optional[str] = Query(None, description="Building type (defaults to first available)"),
-    overclock: float = Query(100.0, description="Overclock percentage", ge=1.0, le=250.0)
+    overclock: float = Query(100.0, description="Overclock percentage", ge=1.0, le=250.0),
+    calculator: SatisfactoryCalculator = Depends(get_calculator)
 ):
-    if calculator is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     try:
         result = calculator.calculate_buildings_needed(recipe, target_rate, building, overclock)
         if "error" in result:
@@ -64,11 +49,9 @@ async def get_production_chain(
     item: str = Query(..., description="Item name or class name"),
     target_rate: float = Query(..., description="Target production rate (items per minute)", gt=0),
     include_alternates: bool = Query(True, description="Include alternate recipes in chain"),
-    preferred_recipe: Optional[str] = Query(None, description="Preferred recipe name (for specific alternate)")
+    preferred_recipe: Optional[str] = Query(None, description="Preferred recipe name (for specific alternate)"),
+    calculator: SatisfactoryCalculator = Depends(get_calculator)
 ):
-    if calculator is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     try:
         result = calculator.calculate_production_chain(item, target_rate, include_alternates, preferred_recipe)
         if "error" in result:
@@ -82,11 +65,9 @@ async def get_production_chain(
 
 @router.get("/compare-recipes")
 async def compare_recipes(
-    item: str = Query(..., description="Item name or class name to compare recipes for")
+    item: str = Query(..., description="Item name or class name to compare recipes for"),
+    calculator: SatisfactoryCalculator = Depends(get_calculator)
 ):
-    if calculator is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     try:
         result = calculator.compare_recipes(item)
         if "error" in result:
@@ -103,11 +84,9 @@ async def get_miner_output(
     resource: str = Query(..., description="Resource name"),
     miner_mk: int = Query(..., description="Miner mark (1, 2, or 3)", ge=1, le=3),
     purity: str = Query("normal", description="Purity level: impure, normal, or pure"),
-    overclock: float = Query(100.0, description="Overclock percentage", ge=1.0, le=250.0)
+    overclock: float = Query(100.0, description="Overclock percentage", ge=1.0, le=250.0),
+    calculator: SatisfactoryCalculator = Depends(get_calculator)
 ):
-    if calculator is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     if purity.lower() not in ["impure", "normal", "pure"]:
         raise HTTPException(status_code=400, detail="Purity must be: impure, normal, or pure")
     
@@ -124,11 +103,9 @@ async def get_miner_output(
 
 @router.get("/belt-requirements")
 async def get_belt_requirements(
-    throughput: float = Query(..., description="Required throughput (items per minute)", gt=0)
+    throughput: float = Query(..., description="Required throughput (items per minute)", gt=0),
+    calculator: SatisfactoryCalculator = Depends(get_calculator)
 ):
-    if calculator is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     try:
         result = calculator.calculate_belt_requirements(throughput)
         if "error" in result:
@@ -146,11 +123,9 @@ async def get_perfect_ratios(
     target_rate: float = Query(..., description="Target production rate (items per minute)", gt=0),
     include_alternates: bool = Query(True, description="Include alternate recipes"),
     preferred_recipe: Optional[str] = Query(None, description="Preferred recipe name"),
-    allow_overclock: bool = Query(True, description="Allow overclocking to achieve perfect ratios")
+    allow_overclock: bool = Query(True, description="Allow overclocking to achieve perfect ratios"),
+    calculator: SatisfactoryCalculator = Depends(get_calculator)
 ):
-    if calculator is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     try:
         result = calculator.calculate_perfect_ratios(item, target_rate, include_alternates, preferred_recipe, allow_overclock)
         if "error" in result:
@@ -168,11 +143,9 @@ async def optimize_for_100_percent(
     target_rate: float = Query(..., description="Target production rate (items per minute)", gt=0),
     include_alternates: bool = Query(True, description="Include alternate recipes"),
     preferred_recipe: Optional[str] = Query(None, description="Preferred recipe name"),
-    allow_overclock: bool = Query(True, description="Allow overclocking to achieve 100% efficiency")
+    allow_overclock: bool = Query(True, description="Allow overclocking to achieve 100% efficiency"),
+    calculator: SatisfactoryCalculator = Depends(get_calculator)
 ):
-    if calculator is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     try:
         result = calculator.optimize_for_100_percent_efficiency(item, target_rate, include_alternates, preferred_recipe, allow_overclock)
         if "error" in result:
@@ -190,11 +163,9 @@ async def get_factory_efficiency(
     target_rate: float = Query(..., description="Target production rate (items per minute)", gt=0),
     include_alternates: bool = Query(True, description="Include alternate recipes"),
     preferred_recipe: Optional[str] = Query(None, description="Preferred recipe name"),
-    allow_overclock: bool = Query(True, description="Allow overclocking")
+    allow_overclock: bool = Query(True, description="Allow overclocking"),
+    calculator: SatisfactoryCalculator = Depends(get_calculator)
 ):
-    if calculator is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     try:
         result = calculator.calculate_factory_efficiency(item, target_rate, include_alternates, preferred_recipe, allow_overclock)
         if "error" in result:
@@ -211,11 +182,9 @@ async def get_building_utilization(
     item: str = Query(..., description="Item name or class name"),
     target_rate: float = Query(..., description="Target production rate (items per minute)", gt=0),
     include_alternates: bool = Query(True, description="Include alternate recipes"),
-    preferred_recipe: Optional[str] = Query(None, description="Preferred recipe name")
+    preferred_recipe: Optional[str] = Query(None, description="Preferred recipe name"),
+    calculator: SatisfactoryCalculator = Depends(get_calculator)
 ):
-    if calculator is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     try:
         result = calculator.calculate_building_utilization(item, target_rate, include_alternates, preferred_recipe)
         if "error" in result:
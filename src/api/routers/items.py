@@ -1,55 +1,81 @@
-from fastapi import APIRouter, HTTPException, Query
-from pathlib import Path
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 import logging
 from src.models.item import Item
+from src.models.recipe import Recipe
 from src.parsers.game_descriptor_parser import GameDescriptorParser
+from src.api.dependencies import get_parser
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-DESCRIPTOR_FILE = Path(__file__).parent.parent.parent.parent / "Docs" / "en-US.json"
-
-try:
-    parser = GameDescriptorParser(DESCRIPTOR_FILE)
-except Exception as e:
-    logger.error(f"Failed to load game descriptor file: {e}")
-    parser = None
-
 @router.get("", response_model=List[Item])
 async def get_items(
-    item_type: Optional[str] = Query(None, description="Filter by item type (raw_resource, component, equipment, building_part)")
+    item_type: Optional[str] = Query(None, description="Filter by item type (raw_resource, component, equipment, building_part)"),
+    parser: GameDescriptorParser = Depends(get_parser)
 ):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     try:
         items_data = parser.extract_all_items()
         
         if item_type:
-            items_data = [i for i in items_data if i["item_type"] == item_type]
+            items_data = [i for i in items_data if i.item_type == item_type]
         
-        return [Item(**item) for item in items_data]
+        return [Item.model_validate(item) for item in items_data]
     except Exception as e:
         logger.error(f"Error extracting items: {e}")
         raise HTTPException(status_code=500, detail="Failed to extract item data")
 
 @router.get("/{item_name}", response_model=Item)
-async def get_item(item_name: str):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_item(item_name: str, parser: GameDescriptorParser = Depends(get_parser)):
     try:
-        items_data = parser.extract_all_items()
-        item = next((i for i in items_data if i["class_name"] == item_name or i["display_name"].lower() == item_name.lower()), None)
+        item = parser.name_index("items").find(item_name)
         
         if not item:
             raise HTTPException(status_code=404, detail=f"Item '{item_name}' not found")
         
-        return Item(**item)
+        return Item.model_validate(item)
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error extracting item {item_name}: {e}")
         raise HTTPException(status_code=500, detail="Failed to extract item data")
 
+def _item_recipes(parser: GameDescriptorParser, item_name: str, used_in: bool, alternate_only: Optional[bool]) -> List[Recipe]:
+    item = parser.name_index("items").find(item_name)
+    if not item:
+        raise HTTPException(status_code=404, detail=f"Item '{item_name}' not found")
+    
+    recipe_table = parser.recipe_table()
+    item_usage = parser.item_usage()
+    mask = item_usage.used_in(item.class_name) if used_in else item_usage.produced_by(item.class_name)
+    if alternate_only is not None:
+        mask &= recipe_table.alternate(alternate_only)
+    return [Recipe.model_validate(recipe) for recipe in recipe_table.select(mask)]
+
+@router.get("/{item_name}/produced-by", response_model=List[Recipe])
+async def get_item_producers(
+    item_name: str,
+    alternate_only: Optional[bool] = Query(None, description="Filter to only alternate recipes"),
+    parser: GameDescriptorParser = Depends(get_parser)
+):
+    try:
+        return _item_recipes(parser, item_name, False, alternate_only)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error finding recipes producing {item_name}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to extract recipe data")
+
+@router.get("/{item_name}/used-in", response_model=List[Recipe])
+async def get_item_consumers(
+    item_name: str,
+    alternate_only: Optional[bool] = Query(None, description="Filter to only alternate recipes"),
+    parser: GameDescriptorParser = Depends(get_parser)
+):
+    try:
+        return _item_recipes(parser, item_name, True, alternate_only)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error finding recipes using {item_name}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to extract recipe data")
@@ -1,126 +1,86 @@
-from fastapi import APIRouter, HTTPException, Query
-from pathlib import Path
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 import logging
 from src.models.logistics import (
     ConveyorSplitter, ConveyorMerger, StorageContainer, FluidBuffer, Valve
 )
 from src.parsers.game_descriptor_parser import GameDescriptorParser
+from src.api.dependencies import get_parser
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-DESCRIPTOR_FILE = Path(__file__).parent.parent.parent.parent / "Docs" / "en-US.json"
-
-try:
-    parser = GameDescriptorParser(DESCRIPTOR_FILE)
-except Exception as e:
-    logger.error(f"Failed to load game descriptor file: {e}")
-    parser = None
-
 @router.get("/splitters", response_model=List[ConveyorSplitter])
 async def get_splitters(
-    splitter_type: Optional[str] = Query(None, description="Filter by splitter type (Regular, Smart, Programmable)")
+    splitter_type: Optional[str] = Query(None, description="Filter by splitter type (Regular, Smart, Programmable)"),
+    parser: GameDescriptorParser = Depends(get_parser)
 ):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     try:
         splitters_data = parser.extract_conveyor_splitters()
         
         if splitter_type:
-            splitters_data = [s for s in splitters_data if s.get("splitter_type", "").lower() == splitter_type.lower()]
+            splitters_data = [s for s in splitters_data if s.splitter_type.lower() == splitter_type.lower()]
         
-        return [ConveyorSplitter(**splitter) for splitter in splitters_data]
+        return [ConveyorSplitter.model_validate(splitter) for splitter in splitters_data]
     except Exception as e:
         logger.error(f"Error extracting splitters: {e}")
         raise HTTPException(status_code=500, detail="Failed to extract splitter data")
 
 @router.get("/mergers", response_model=List[ConveyorMerger])
-async def get_mergers():
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_mergers(parser: GameDescriptorParser = Depends(get_parser)):
     try:
         mergers_data = parser.extract_conveyor_mergers()
-        return [ConveyorMerger(**merger) for merger in mergers_data]
+        return [ConveyorMerger.model_validate(merger) for merger in mergers_data]
     except Exception as e:
         logger.error(f"Error extracting mergers: {e}")
         raise HTTPException(status_code=500, detail="Failed to extract merger data")
 
 @router.get("/storage", response_model=List[StorageContainer])
 async def get_storage_containers(
-    container_type: Optional[str] = Query(None, description="Filter by container type (Storage, Industrial, Buffer)")
+    container_type: Optional[str] = Query(None, description="Filter by container type (Storage, Industrial, Buffer)"),
+    parser: GameDescriptorParser = Depends(get_parser)
 ):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     try:
         containers_data = parser.extract_storage_containers()
         
         if container_type:
-            containers_data = [c for c in containers_data if c.get("container_type", "").lower() == container_type.lower()]
+            containers_data = [c for c in containers_data if c.container_type.lower() == container_type.lower()]
         
-        return [StorageContainer(**container) for container in containers_data]
+        return [StorageContainer.model_validate(container) for container in containers_data]
     except Exception as e:
         logger.error(f"Error extracting storage containers: {e}")
         raise HTTPException(status_code=500, detail="Failed to extract storage container data")
 
 @router.get("/fluid-buffers", response_model=List[FluidBuffer])
-async def get_fluid_buffers():
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_fluid_buffers(parser: GameDescriptorParser = Depends(get_parser)):
     try:
         buffers_data = parser.extract_fluid_buffers()
-        return [FluidBuffer(**buffer) for buffer in buffers_data]
+        return [FluidBuffer.model_validate(buffer) for buffer in buffers_data]
     except Exception as e:
         logger.error(f"Error extracting fluid buffers: {e}")
         raise HTTPException(status_code=500, detail="Failed to extract fluid buffer data")
 
 @router.get("/valves", response_model=List[Valve])
 async def get_valves(
-    valve_type: Optional[str] = Query(None, description="Filter by valve type (Regular, Inverted)")
+    valve_type: Optional[str] = Query(None, description="Filter by valve type (Regular, Inverted)"),
+    parser: GameDescriptorParser = Depends(get_parser)
 ):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     try:
         valves_data = parser.extract_valves()
         
         if valve_type:
-            valves_data = [v for v in valves_data if v.get("valve_type", "").lower() == valve_type.lower()]
+            valves_data = [v for v in valves_data if v.valve_type.lower() == valve_type.lower()]
         
-        return [Valve(**valve) for valve in valves_data]
+        return [Valve.model_validate(valve) for valve in valves_data]
     except Exception as e:
         logger.error(f"Error extracting valves: {e}")
         raise HTTPException(status_code=500, detail="Failed to extract valve data")
 
-def _get_value(d: dict, *keys: str):
-    for k in keys:
-        if k in d and d[k] is not None:
-            return d[k]
-    return None
-
-
 @router.get("/splitters/{splitter_name}", response_model=ConveyorSplitter)
-async def get_splitter_by_name(splitter_name: str):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_splitter_by_name(splitter_name: str, parser: GameDescriptorParser = Depends(get_parser)):
     try:
-        splitters_data = parser.extract_conveyor_splitters()
         target = splitter_name.lower().replace("-", " ")
-        splitter = None
-        for s in splitters_data:
-            display = _get_value(s, "display_name", "displayName")
-            stype = _get_value(s, "splitter_type", "splitterType")
-            if isinstance(display, str) and display.lower() == target:
-                splitter = s
-                break
-            if isinstance(stype, str) and stype.lower() == target:
-                splitter = s
-                break
+        splitter = parser.name_index("conveyor_splitters").find(splitter_name)
         
         if not splitter:
             if target in ("conveyor splitter", "regular"):
@@ -149,7 +109,7 @@ async def get_splitter_by_name(splitter_name: str):
                 return ConveyorSplitter(**fallback)
             raise HTTPException(status_code=404, detail=f"Splitter '{splitter_name}' not found")
         
-        return ConveyorSplitter(**splitter)
+        return ConveyorSplitter.model_validate(splitter)
     except HTTPException:
         raise
     except Exception as e:
@@ -157,19 +117,10 @@ async def get_splitter_by_name(splitter_name: str):
         raise HTTPException(status_code=500, detail="Failed to extract splitter data")
 
 @router.get("/mergers/{merger_name}", response_model=ConveyorMerger)
-async def get_merger_by_name(merger_name: str):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_merger_by_name(merger_name: str, parser: GameDescriptorParser = Depends(get_parser)):
     try:
-        mergers_data = parser.extract_conveyor_mergers()
         target = merger_name.lower().replace("-", " ")
-        merger = None
-        for m in mergers_data:
-            display = _get_value(m, "display_name", "displayName")
-            if isinstance(display, str) and display.lower() == target:
-                merger = m
-                break
+        merger = parser.name_index("conveyor_mergers").find(merger_name)
         
         if not merger:
             if target == "conveyor merger":
@@ -185,7 +136,7 @@ async def get_merger_by_name(merger_name: str):
                 return ConveyorMerger(**fallback)
             raise HTTPException(status_code=404, detail=f"Merger '{merger_name}' not found")
         
-        return ConveyorMerger(**merger)
+        return ConveyorMerger.model_validate(merger)
     except HTTPException:
         raise
     except Exception as e:
@@ -193,23 +144,10 @@ async def get_merger_by_name(merger_name: str):
         raise HTTPException(status_code=500, detail="Failed to extract merger data")
 
 @router.get("/storage/{container_name}", response_model=StorageContainer)
-async def get_storage_container_by_name(container_name: str):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_storage_container_by_name(container_name: str, parser: GameDescriptorParser = Depends(get_parser)):
     try:
-        containers_data = parser.extract_storage_containers()
         target = container_name.lower().replace("-", " ")
-        container = None
-        for c in containers_data:
-            display = _get_value(c, "display_name", "displayName")
-            ctype = _get_value(c, "container_type", "containerType")
-            if isinstance(display, str) and display.lower() == target:
-                container = c
-                break
-            if isinstance(ctype, str) and ctype.lower() == target:
-                container = c
-                break
+        container = parser.name_index("storage_containers").find(container_name)
         
         if not container:
             if target in ("storage container", "storage"):
@@ -227,7 +165,7 @@ async def get_storage_container_by_name(container_name: str):
                 return StorageContainer(**fallback)
             raise HTTPException(status_code=404, detail=f"Storage container '{container_name}' not found")
         
-        return StorageContainer(**container)
+        return StorageContainer.model_validate(container)
     except HTTPException:
         raise
     except Exception as e:
@@ -235,23 +173,10 @@ async def get_storage_container_by_name(container_name: str):
         raise HTTPException(status_code=500, detail="Failed to extract storage container data")
 
 @router.get("/valves/{valve_name}", response_model=Valve)
-async def get_valve_by_name(valve_name: str):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_valve_by_name(valve_name: str, parser: GameDescriptorParser = Depends(get_parser)):
     try:
-        valves_data = parser.extract_valves()
         target = valve_name.lower().replace("-", " ")
-        valve = None
-        for v in valves_data:
-            display = _get_value(v, "display_name", "displayName")
-            vtype = _get_value(v, "valve_type", "valveType")
-            if isinstance(display, str) and display.lower() == target:
-                valve = v
-                break
-            if isinstance(vtype, str) and vtype.lower() == target:
-                valve = v
-                break
+        valve = parser.name_index("valves").find(valve_name)
         
         if not valve:
             if target == "inverted":
@@ -267,7 +192,7 @@ async def get_valve_by_name(valve_name: str):
                 return Valve(**fallback)
             raise HTTPException(status_code=404, detail=f"Valve '{valve_name}' not found")
         
-        return Valve(**valve)
+        return Valve.model_validate(valve)
     except HTTPException:
         raise
     except Exception as e:
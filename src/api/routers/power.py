@@ -1,52 +1,38 @@
-from fastapi import APIRouter, HTTPException, Query
-from pathlib import Path
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 import logging
 from src.models.power import PowerGenerator, PowerStorage, PowerPole
 from src.parsers.game_descriptor_parser import GameDescriptorParser
+from src.api.dependencies import get_parser
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-DESCRIPTOR_FILE = Path(__file__).parent.parent.parent.parent / "Docs" / "en-US.json"
-
-try:
-    parser = GameDescriptorParser(DESCRIPTOR_FILE)
-except Exception as e:
-    logger.error(f"Failed to load game descriptor file: {e}")
-    parser = None
-
 @router.get("/generators", response_model=List[PowerGenerator])
 async def get_power_generators(
-    generator_type: Optional[str] = Query(None, description="Filter by generator type (Biomass, Coal, Fuel, Geothermal, Nuclear)")
+    generator_type: Optional[str] = Query(None, description="Filter by generator type (Biomass, Coal, Fuel, Geothermal, Nuclear)"),
+    parser: GameDescriptorParser = Depends(get_parser)
 ):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
     try:
         generators_data = parser.extract_power_generators()
         
         if generator_type:
-            generators_data = [g for g in generators_data if g.get("generator_type", "").lower() == generator_type.lower()]
+            generators_data = [g for g in generators_data if g.generator_type.lower() == generator_type.lower()]
         
-        return [PowerGenerator(**generator) for generator in generators_data]
+        return [PowerGenerator.model_validate(generator) for generator in generators_data]
     except Exception as e:
         logger.error(f"Error extracting power generators: {e}")
         raise HTTPException(status_code=500, detail="Failed to extract power generator data")
 
 @router.get("/generators/{generator_type}", response_model=PowerGenerator)
-async def get_power_generator(generator_type: str):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_power_generator(generator_type: str, parser: GameDescriptorParser = Depends(get_parser)):
     try:
-        generators_data = parser.extract_power_generators()
-        generator = next((g for g in generators_data if g.get("generator_type", "").lower() == generator_type.lower()), None)
+        generator = parser.name_index("power_generators").find(generator_type)
         
         if not generator:
             raise HTTPException(status_code=404, detail=f"Power generator type '{generator_type}' not found")
         
-        return PowerGenerator(**generator)
+        return PowerGenerator.model_validate(generator)
     except HTTPException:
         raise
     except Exception as e:
@@ -54,76 +40,47 @@ async def get_power_generator(generator_type: str):
         raise HTTPException(status_code=500, detail="Failed to extract power generator data")
 
 @router.get("/storage", response_model=List[PowerStorage])
-async def get_power_storage():
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_power_storage(parser: GameDescriptorParser = Depends(get_parser)):
     try:
         storage_data = parser.extract_power_storage()
-        return [PowerStorage(**storage) for storage in storage_data]
+        return [PowerStorage.model_validate(storage) for storage in storage_data]
     except Exception as e:
         logger.error(f"Error extracting power storage: {e}")
         raise HTTPException(status_code=500, detail="Failed to extract power storage data")
 
 @router.get("/poles", response_model=List[PowerPole])
-async def get_power_poles():
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_power_poles(parser: GameDescriptorParser = Depends(get_parser)):
     try:
         poles_data = parser.extract_power_poles()
-        return [PowerPole(**pole) for pole in poles_data]
+        return [PowerPole.model_validate(pole) for pole in poles_data]
     except Exception as e:
         logger.error(f"Error extracting power poles: {e}")
         raise HTTPException(status_code=500, detail="Failed to extract power pole data")
 
 @router.get("/poles/{mk}", response_model=PowerPole)
-async def get_power_pole(mk: int):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_power_pole(mk: int, parser: GameDescriptorParser = Depends(get_parser)):
     if mk not in [1, 2, 3]:
         raise HTTPException(status_code=404, detail=f"Power Pole Mk.{mk} not found. Valid values are 1, 2, or 3")
     
     try:
         poles_data = parser.extract_power_poles()
-        pole = next((p for p in poles_data if p["mk"] == mk), None)
+        pole = next((p for p in poles_data if p.mk == mk), None)
         
         if not pole:
             raise HTTPException(status_code=404, detail=f"Power Pole Mk.{mk} not found")
         
-        return PowerPole(**pole)
+        return PowerPole.model_validate(pole)
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error extracting power pole Mk.{mk}: {e}")
         raise HTTPException(status_code=500, detail="Failed to extract power pole data")
 
-def _get_value(d: dict, *keys: str):
-    for k in keys:
-        if k in d and d[k] is not None:
-            return d[k]
-    return None
-
-
 @router.get("/generators/name/{generator_name}", response_model=PowerGenerator)
-async def get_power_generator_by_name(generator_name: str):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_power_generator_by_name(generator_name: str, parser: GameDescriptorParser = Depends(get_parser)):
     try:
-        generators_data = parser.extract_power_generators()
         target = generator_name.lower().replace("-", " ")
-        generator = None
-        for g in generators_data:
-            display = _get_value(g, "display_name", "displayName")
-            gtype = _get_value(g, "generator_type", "generatorType")
-            if isinstance(display, str) and display.lower() == target:
-                generator = g
-                break
-            if isinstance(gtype, str) and gtype.lower() == target:
-                generator = g
-                break
+        generator = parser.name_index("power_generators").find(generator_name)
         
         if not generator:
             if target == "coal generator":
@@ -143,7 +100,7 @@ async def get_power_generator_by_name(generator_name: str):
                 return PowerGenerator(**fallback)
             raise HTTPException(status_code=404, detail=f"Power generator '{generator_name}' not found")
         
-        return PowerGenerator(**generator)
+        return PowerGenerator.model_validate(generator)
     except HTTPException:
         raise
     except Exception as e:
@@ -151,19 +108,10 @@ async def get_power_generator_by_name(generator_name: str):
         raise HTTPException(status_code=500, detail="Failed to extract power generator data")
 
 @router.get("/storage/{storage_name}", response_model=PowerStorage)
-async def get_power_storage_by_name(storage_name: str):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_power_storage_by_name(storage_name: str, parser: GameDescriptorParser = Depends(get_parser)):
     try:
-        storage_data = parser.extract_power_storage()
         target = storage_name.lower().replace("-", " ")
-        storage = None
-        for s in storage_data:
-            display = _get_value(s, "display_name", "displayName")
-            if isinstance(display, str) and display.lower() == target:
-                storage = s
-                break
+        storage = parser.name_index("power_storage").find(storage_name)
         
         if not storage:
             if target == "power storage":
@@ -181,7 +129,7 @@ async def get_power_storage_by_name(storage_name: str):
                 return PowerStorage(**fallback)
             raise HTTPException(status_code=404, detail=f"Power storage '{storage_name}' not found")
         
-        return PowerStorage(**storage)
+        return PowerStorage.model_validate(storage)
     except HTTPException:
         raise
     except Exception as e:
@@ -189,18 +137,15 @@ async def get_power_storage_by_name(storage_name: str):
         raise HTTPException(status_code=500, detail="Failed to extract power storage data")
 
 @router.get("/generators/tier/{tier}", response_model=List[PowerGenerator])
-async def get_power_generators_by_tier(tier: int):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_power_generators_by_tier(tier: int, parser: GameDescriptorParser = Depends(get_parser)):
     try:
         generators_data = parser.extract_power_generators()
-        tier_generators = [g for g in generators_data if g.get("tier_unlocked") == tier]
+        tier_generators = [g for g in generators_data if g.tier_unlocked == tier]
         
         if not tier_generators:
             raise HTTPException(status_code=404, detail=f"No power generators found for tier {tier}")
         
-        return [PowerGenerator(**generator) for generator in tier_generators]
+        return [PowerGenerator.model_validate(generator) for generator in tier_generators]
     except HTTPException:
         raise
     except Exception as e:
@@ -208,21 +153,14 @@ async def get_power_generators_by_tier(tier: int):
         raise HTTPException(status_code=500, detail="Failed to extract power generator data")
 
 @router.get("/poles/name/{pole_name}", response_model=PowerPole)
-async def get_power_pole_by_name(pole_name: str):
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_power_pole_by_name(pole_name: str, parser: GameDescriptorParser = Depends(get_parser)):
     try:
-        poles_data = parser.extract_power_poles()
-        pole = next(
-            (p for p in poles_data if p.get("display_name", "").lower() == pole_name.lower().replace("-", " ")),
-            None
-        )
+        pole = parser.name_index("power_poles").find(pole_name)
         
         if not pole:
             raise HTTPException(status_code=404, detail=f"Power pole '{pole_name}' not found")
         
-        return PowerPole(**pole)
+        return PowerPole.model_validate(pole)
     except HTTPException:
         raise
     except Exception as e:
@@ -1,42 +1,28 @@
-from fastapi import APIRouter, HTTPException
-from pathlib import Path
+from fastapi import APIRouter, Depends, HTTPException
 from typing import List
 import logging
 from src.models.resource_node import ResourceNode
 from src.models.raw_resource import RawResource
 from src.parsers.game_descriptor_parser import GameDescriptorParser
+from src.api.dependencies import get_parser
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-DESCRIPTOR_FILE = Path(__file__).parent.parent.parent.parent / "Docs" / "en-US.json"
-
-try:
-    parser = GameDescriptorParser(DESCRIPTOR_FILE)
-except Exception as e:
-    logger.error(f"Failed to load game descriptor file: {e}")
-    parser = None
-
 @router.get("/resource-nodes", response_model=List[ResourceNode])
-async def get_resource_nodes():
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_resource_nodes(parser: GameDescriptorParser = Depends(get_parser)):
     try:
         nodes_data = parser.extract_resource_nodes()
-        return [ResourceNode(**node) for node in nodes_data]
+        return [ResourceNode.model_validate(node) for node in nodes_data]
     except Exception as e:
         logger.error(f"Error extracting resource nodes: {e}")
         raise HTTPException(status_code=500, detail="Failed to extract resource node data")
 
 @router.get("/raw-resources", response_model=List[RawResource])
-async def get_raw_resources():
-    if parser is None:
-        raise HTTPException(status_code=500, detail="Game descriptor data not available")
-    
+async def get_raw_resources(parser: GameDescriptorParser = Depends(get_parser)):
     try:
         resources_data = parser.extract_raw_resources()
-        return [RawResource(**resource) for resource in resources_data]
+        return [RawResource.model_validate(resource) for resource in resources_data]
     except Exception as e:
         logger.error(f"Error extracting raw resources: {e}")
         raise HTTPException(status_code=500, detail="Failed to extract raw resource data")
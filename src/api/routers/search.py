@@ -0,0 +1,61 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
+import logging
+from src.models.search import DescriptionSearchResult, SearchResult
+from src.parsers.game_descriptor_parser import GameDescriptorParser
+from src.api.dependencies import get_parser
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+@router.get("", response_model=List[SearchResult])
+async def search(
+    q: str = Query(..., description="Partial or misspelled name to search for"),
+    entity_type: Optional[str] = Query(None, alias="type", description="Limit results to one kind of entity (items, recipes, buildings)"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of results"),
+    parser: GameDescriptorParser = Depends(get_parser)
+):
+    if entity_type is not None and entity_type not in GameDescriptorParser.SEARCH_DATASETS:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Search type '{entity_type}' not found. Valid values are: {', '.join(GameDescriptorParser.SEARCH_DATASETS)}"
+        )
+    
+    try:
+        hits = parser.search_index().search(q, entity_type, limit)
+        return [
+            SearchResult(type=dataset, class_name=record.class_name, display_name=record.display_name, score=round(score, 3))
+            for dataset, record, score in hits
+        ]
+    except Exception as e:
+        logger.error(f"Error searching for '{q}': {e}")
+        raise HTTPException(status_code=500, detail="Failed to search game data")
+
+@router.get("/descriptions", response_model=List[DescriptionSearchResult])
+async def search_descriptions(
+    q: str = Query(..., description="Words to look for in entity descriptions"),
+    entity_type: Optional[str] = Query(None, alias="type", description="Limit results to one dataset, such as buildings or items"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of results"),
+    parser: GameDescriptorParser = Depends(get_parser)
+):
+    if entity_type is not None and entity_type not in GameDescriptorParser.DESCRIPTION_DATASETS:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Search type '{entity_type}' not found. Valid values are: {', '.join(GameDescriptorParser.DESCRIPTION_DATASETS)}"
+        )
+    
+    try:
+        hits = parser.description_index().search(q, entity_type, limit)
+        return [
+            DescriptionSearchResult(
+                type=dataset,
+                class_name=record.class_name,
+                display_name=record.display_name or record.class_name,
+                description=record.description,
+                score=round(score, 3)
+            )
+            for dataset, record, score in hits
+        ]
+    except Exception as e:
+        logger.error(f"Error searching descriptions for '{q}': {e}")
+        raise HTTPException(status_code=500, detail="Failed to search game data")
@@ -0,0 +1,16 @@
+from typing import Any, Callable, Dict
+
+VERSION_HEADER = "X-Game-Version"
+VERSION_PATH_PREFIX = "/versions/"
+
+class GameVersionPathMiddleware:
+    def __init__(self, app: Callable):
+        self.app = app
+    
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable):
+        if scope["type"] == "http" and scope["path"].startswith(VERSION_PATH_PREFIX):
+            version, _, rest = scope["path"][len(VERSION_PATH_PREFIX):].partition("/")
+            if version:
+                path = f"/{rest}"
+                scope = dict(scope, path=path, raw_path=path.encode(), game_version=version)
+        await self.app(scope, receive, send)
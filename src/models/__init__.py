@@ -15,6 +15,10 @@ from src.models.logistics import (
 )
 from src.models.extractors import WaterExtractor, ResourceWellExtractor
 from src.models.progression import Milestone, Unlock
+from src.models.search import DescriptionSearchResult, SearchResult
+from src.models.admin import (
+    DatasetStatus, DatasetDiff, DerivedFallback, DerivedValuesReport, DescriptorDiff, EntityChange, FieldChange
+)
 
 __all__ = [
     "Miner", "Belt", "ResourceNode", "PurityLevel", "RawResource",
@@ -25,6 +29,9 @@ __all__ = [
     "PowerGenerator", "PowerStorage", "PowerPole",
     "ConveyorSplitter", "ConveyorMerger", "StorageContainer", "FluidBuffer", "Valve",
     "WaterExtractor", "ResourceWellExtractor",
-    "Milestone", "Unlock"
+    "Milestone", "Unlock",
+    "SearchResult", "DescriptionSearchResult",
+    "DatasetStatus", "DatasetDiff", "DerivedFallback", "DerivedValuesReport", "DescriptorDiff", "EntityChange",
+    "FieldChange"
 ]
 
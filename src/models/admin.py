@@ -0,0 +1,44 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+class DatasetStatus(BaseModel):
+    version: str = Field(..., description="Game version the dataset belongs to")
+    generation: int = Field(..., description="Dataset generation, incremented on every successful reload")
+    descriptor_file: str = Field(..., description="Descriptor file the dataset was built from")
+    source: str = Field(..., description="How the descriptor was loaded (json, json-stream, json-lazy, snapshot)")
+    encoding: Optional[str] = Field(None, description="Detected descriptor encoding")
+    load_ms: float = Field(..., description="Time spent loading the descriptor in milliseconds")
+    
+    class Config:
+        populate_by_name = True
+
+class FieldChange(BaseModel):
+    old: Any = Field(None, description="Value in the base version")
+    new: Any = Field(None, description="Value in the target version")
+    delta: Optional[float] = Field(None, description="new - old for numeric fields")
+
+class EntityChange(BaseModel):
+    key: str = Field(..., description="Class name (or composite key) of the changed entity")
+    changes: Dict[str, FieldChange] = Field(..., description="Changed fields")
+
+class DatasetDiff(BaseModel):
+    added: List[str] = Field(default_factory=list, description="Entities only present in the target version")
+    removed: List[str] = Field(default_factory=list, description="Entities only present in the base version")
+    changed: List[EntityChange] = Field(default_factory=list, description="Entities whose fields differ")
+
+class DescriptorDiff(BaseModel):
+    base_version: str = Field(..., description="Version compared from")
+    target_version: str = Field(..., description="Version compared to")
+    datasets: Dict[str, DatasetDiff] = Field(..., description="Differences per dataset; unchanged datasets are omitted")
+    diff_ms: float = Field(..., description="Time spent computing the diff in milliseconds")
+
+class DerivedFallback(BaseModel):
+    dataset: str = Field(..., description="Dataset the value belongs to")
+    class_name: str = Field(..., description="Class whose description did not yield the value")
+    field: str = Field(..., description="Record field that fell back")
+    value: float = Field(..., description="Value used instead")
+    source: str = Field(..., description="Where the value came from (default or the descriptor field used)")
+
+class DerivedValuesReport(BaseModel):
+    version: str = Field(..., description="Game version the report belongs to")
+    fallbacks: List[DerivedFallback] = Field(..., description="Description-derived values that fell back instead of being parsed")
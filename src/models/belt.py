@@ -9,4 +9,5 @@ class Belt(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
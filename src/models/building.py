@@ -13,4 +13,5 @@ class Building(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
@@ -11,6 +11,7 @@ class WaterExtractor(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class ResourceWellExtractor(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -23,4 +24,5 @@ class ResourceWellExtractor(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
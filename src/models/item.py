@@ -10,4 +10,5 @@ class Item(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
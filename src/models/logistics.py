@@ -13,6 +13,7 @@ class ConveyorSplitter(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class ConveyorMerger(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -25,6 +26,7 @@ class ConveyorMerger(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class StorageContainer(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -39,6 +41,7 @@ class StorageContainer(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class FluidBuffer(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -52,6 +55,7 @@ class FluidBuffer(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class Valve(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -64,4 +68,5 @@ class Valve(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
@@ -14,4 +14,5 @@ class Miner(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
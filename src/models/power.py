@@ -16,6 +16,7 @@ class PowerGenerator(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class PowerStorage(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -30,6 +31,7 @@ class PowerStorage(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class PowerPole(BaseModel):
     mk: int = Field(..., description="Power pole mark version (1, 2, or 3)")
@@ -41,4 +43,5 @@ class PowerPole(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
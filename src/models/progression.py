@@ -11,6 +11,7 @@ class Milestone(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class Unlock(BaseModel):
     class_name: str = Field(..., description="Item or building class name", alias="className")
@@ -22,4 +23,5 @@ class Unlock(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
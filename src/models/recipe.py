@@ -4,10 +4,18 @@ from typing import List, Optional
 class RecipeIngredient(BaseModel):
     item_class: str = Field(..., description="Game class name of the ingredient item", alias="itemClass")
     amount: int = Field(..., description="Amount of the ingredient required")
+    
+    class Config:
+        populate_by_name = True
+        from_attributes = True
 
 class RecipeProduct(BaseModel):
     item_class: str = Field(..., description="Game class name of the product item", alias="itemClass")
     amount: int = Field(..., description="Amount of the product produced")
+    
+    class Config:
+        populate_by_name = True
+        from_attributes = True
 
 class Recipe(BaseModel):
     class_name: str = Field(..., description="Game class name of the recipe", alias="className")
@@ -22,4 +30,5 @@ class Recipe(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
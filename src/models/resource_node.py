@@ -15,4 +15,5 @@ class ResourceNode(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+
+class SearchResult(BaseModel):
+    type: str = Field(..., description="Kind of entity (items, recipes, buildings)")
+    class_name: str = Field(..., description="Game class name", alias="className")
+    display_name: str = Field(..., description="Display name", alias="displayName")
+    score: float = Field(..., description="Share of the query's trigrams found in the name, from 0 to 1")
+    
+    class Config:
+        populate_by_name = True
+
+class DescriptionSearchResult(BaseModel):
+    type: str = Field(..., description="Kind of entity, such as items, buildings or power_generators")
+    class_name: str = Field(..., description="Game class name", alias="className")
+    display_name: str = Field(..., description="Display name", alias="displayName")
+    description: str = Field(..., description="Description text that matched the query")
+    score: float = Field(..., description="BM25 relevance of the description to the query")
+    
+    class Config:
+        populate_by_name = True
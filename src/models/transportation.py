@@ -12,6 +12,7 @@ class TrainLocomotive(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class TrainFreightCar(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -23,6 +24,7 @@ class TrainFreightCar(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class TrainStation(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -34,6 +36,7 @@ class TrainStation(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class TruckVehicle(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -47,6 +50,7 @@ class TruckVehicle(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class TruckStation(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -57,6 +61,7 @@ class TruckStation(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class Drone(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -69,6 +74,7 @@ class Drone(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class DroneStation(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -81,6 +87,7 @@ class DroneStation(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class Pipeline(BaseModel):
     mk: int = Field(..., description="Pipeline mark version (1 or 2)")
@@ -91,6 +98,7 @@ class Pipeline(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class PipelinePump(BaseModel):
     mk: int = Field(..., description="Pump mark version (1 or 2)")
@@ -103,6 +111,7 @@ class PipelinePump(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class FreightPlatform(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -115,6 +124,7 @@ class FreightPlatform(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class RailwayTrack(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -126,6 +136,7 @@ class RailwayTrack(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
 class TrainSignal(BaseModel):
     class_name: str = Field(..., description="Game class name", alias="className")
@@ -137,4 +148,5 @@ class TrainSignal(BaseModel):
     
     class Config:
         populate_by_name = True
+        from_attributes = True
 
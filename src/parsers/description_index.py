@@ -0,0 +1,75 @@
+import heapq
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.parsers.records import Record
+from src.parsers.search_index import search_words
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+def description_terms(text: str) -> List[str]:
+    terms = []
+    for word in search_words(text):
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+class DescriptionIndex:
+    def __init__(self, datasets: Dict[str, Sequence[Record]]):
+        self.datasets = datasets
+        self.documents: List[Tuple[str, int]] = []
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._dataset_ranges: Dict[str, Tuple[int, int]] = {}
+        lengths: List[int] = []
+        
+        for dataset, records in datasets.items():
+            first = len(self.documents)
+            for row, record in enumerate(records):
+                terms = description_terms(record.description or "")
+                if not terms:
+                    continue
+                document = len(self.documents)
+                self.documents.append((dataset, row))
+                lengths.append(len(terms))
+                counts: Dict[str, int] = {}
+                for term in terms:
+                    counts[term] = counts.get(term, 0) + 1
+                for term, count in counts.items():
+                    self._postings.setdefault(term, []).append((document, count))
+            self._dataset_ranges[dataset] = (first, len(self.documents))
+        
+        average_length = sum(lengths) / len(lengths) if lengths else 0.0
+        self._length_norms = [
+            BM25_K1 * (1 - BM25_B + BM25_B * length / average_length) for length in lengths
+        ]
+    
+    def __len__(self) -> int:
+        return len(self.documents)
+    
+    def _idf(self, document_count: int) -> float:
+        return math.log(1 + (len(self.documents) - document_count + 0.5) / (document_count + 0.5))
+    
+    def search(self, query: str, dataset: Optional[str] = None, limit: int = 10) -> List[Tuple[str, Record, float]]:
+        terms = dict.fromkeys(description_terms(query))
+        if not terms or limit <= 0:
+            return []
+        
+        first, last = self._dataset_ranges.get(dataset, (0, 0)) if dataset else (0, len(self.documents))
+        scores: Dict[int, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf(len(postings))
+            for document, count in postings:
+                if first <= document < last:
+                    weight = idf * count * (BM25_K1 + 1) / (count + self._length_norms[document])
+                    scores[document] = scores.get(document, 0.0) + weight
+        
+        best = heapq.nsmallest(limit, scores.items(), key=lambda hit: (-hit[1], hit[0]))
+        hits = []
+        for document, score in best:
+            dataset_name, row = self.documents[document]
+            hits.append((dataset_name, self.datasets[dataset_name][row], score))
+        return hits
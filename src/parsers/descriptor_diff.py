@@ -0,0 +1,65 @@
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+from src.parsers.records import Record
+
+DIFF_KEYS: Dict[str, Tuple[str, ...]] = {
+    "resource_nodes": ("resource_type", "purity")
+}
+DEFAULT_DIFF_KEY = ("class_name",)
+
+def to_plain(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(item) for item in value]
+    return value
+
+def _entity_key(record: Mapping[str, Any], key_fields: Sequence[str]) -> str:
+    return ":".join(str(record.get(field, "")) for field in key_fields)
+
+def _index_records(records: List[Record], key_fields: Sequence[str]) -> Dict[str, Record]:
+    index = {}
+    for record in records:
+        index.setdefault(_entity_key(record, key_fields), record)
+    return index
+
+def _field_change(old: Any, new: Any) -> Dict[str, Any]:
+    change = {"old": to_plain(old), "new": to_plain(new)}
+    if isinstance(old, (int, float)) and isinstance(new, (int, float)) and not isinstance(old, bool) and not isinstance(new, bool):
+        change["delta"] = new - old
+    return change
+
+def diff_records(old: Mapping[str, Any], new: Mapping[str, Any]) -> Dict[str, Dict[str, Any]]:
+    changes = {}
+    for field in dict.fromkeys([*old.keys(), *new.keys()]):
+        old_value = old.get(field)
+        new_value = new.get(field)
+        if old_value != new_value:
+            changes[field] = _field_change(old_value, new_value)
+    return changes
+
+def diff_dataset(old_records: List[Record], new_records: List[Record], key_fields: Sequence[str] = DEFAULT_DIFF_KEY) -> Dict[str, Any]:
+    old_index = _index_records(old_records, key_fields)
+    new_index = _index_records(new_records, key_fields)
+    
+    changed = []
+    for key, new_record in new_index.items():
+        old_record = old_index.get(key)
+        if old_record is None or old_record is new_record:
+            continue
+        changes = diff_records(old_record, new_record)
+        if changes:
+            changed.append({"key": key, "changes": changes})
+    
+    return {
+        "added": [key for key in new_index if key not in old_index],
+        "removed": [key for key in old_index if key not in new_index],
+        "changed": changed
+    }
+
+def diff_datasets(old: Dict[str, List[Record]], new: Dict[str, List[Record]]) -> Dict[str, Dict[str, Any]]:
+    result = {}
+    for name in dict.fromkeys([*old.keys(), *new.keys()]):
+        dataset_diff = diff_dataset(old.get(name, []), new.get(name, []), DIFF_KEYS.get(name, DEFAULT_DIFF_KEY))
+        if dataset_diff["added"] or dataset_diff["removed"] or dataset_diff["changed"]:
+            result[name] = dataset_diff
+    return result
@@ -0,0 +1,79 @@
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from src.parsers.descriptor_stream import detect_encoding
+
+_BLOCK_START_PATTERN = re.compile(r'\{\s*"NativeClass"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_CLASS_NAME_PATTERN = re.compile(r'"ClassName"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_json_decoder = json.JSONDecoder()
+
+class DescriptorBlock(NamedTuple):
+    native_class: str
+    start: int
+    end: int
+    class_names: Tuple[str, ...]
+    has_schematic_keys: bool
+
+class DescriptorBlockIndex:
+    def __init__(self, text: str, schematic_keys: Iterable[str]):
+        self._text: Optional[str] = text
+        self._loaded: Set[int] = set()
+        self._lock = threading.Lock()
+        self.blocks: List[DescriptorBlock] = []
+        self.first_block_by_class: Dict[str, int] = {}
+        
+        schematic_pattern = re.compile("|".join(rf'"{re.escape(key)}"\s*:' for key in schematic_keys))
+        starts = [(match.start(), match.group(1)) for match in _BLOCK_START_PATTERN.finditer(text)]
+        if not starts and text.strip() not in ("", "[]"):
+            raise ValueError("No NativeClass blocks found in descriptor")
+        
+        for block_id, (start, native_class) in enumerate(starts):
+            end = starts[block_id + 1][0] if block_id + 1 < len(starts) else len(text)
+            class_names = tuple(match.group(1) for match in _CLASS_NAME_PATTERN.finditer(text, start, end))
+            for class_name in class_names:
+                self.first_block_by_class.setdefault(class_name, block_id)
+            self.blocks.append(DescriptorBlock(
+                native_class, start, end, class_names, schematic_pattern.search(text, start, end) is not None
+            ))
+    
+    @classmethod
+    def from_file(cls, descriptor_file: Path, schematic_keys: Iterable[str]) -> Tuple["DescriptorBlockIndex", str]:
+        raw = descriptor_file.read_bytes()
+        encoding = detect_encoding(raw)
+        return cls(raw.decode(encoding), schematic_keys), encoding
+    
+    @property
+    def fully_loaded(self) -> bool:
+        return len(self._loaded) == len(self.blocks)
+    
+    def blocks_with_class_prefix(self, prefix: str) -> List[int]:
+        return [
+            block_id for block_id, block in enumerate(self.blocks)
+            if any(class_name.startswith(prefix) for class_name in block.class_names)
+        ]
+    
+    def blocks_with_schematic_keys(self) -> List[int]:
+        return [block_id for block_id, block in enumerate(self.blocks) if block.has_schematic_keys]
+    
+    def load_blocks(self, block_ids: Iterable[int], on_load: Callable[[int, List[Dict[str, Any]]], None]):
+        missing = [block_id for block_id in block_ids if block_id not in self._loaded]
+        if not missing:
+            return
+        
+        with self._lock:
+            for block_id in missing:
+                if block_id in self._loaded:
+                    continue
+                block = self.blocks[block_id]
+                entry, _ = _json_decoder.raw_decode(self._text, block.start)
+                classes = entry.get("Classes", []) if isinstance(entry, dict) else []
+                on_load(block_id, classes)
+                self._loaded.add(block_id)
+            
+            if self.fully_loaded:
+                self._text = None
+    
+    def load_all(self, on_load: Callable[[int, List[Dict[str, Any]]], None]):
+        self.load_blocks(range(len(self.blocks)), on_load)
@@ -0,0 +1,134 @@
+import codecs
+import json
+from pathlib import Path
+from typing import Any, AbstractSet, BinaryIO, Dict, Iterator, List, Optional
+
+CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = " \t\n\r"
+_json_decoder = json.JSONDecoder()
+
+def detect_encoding(raw: bytes) -> str:
+    if raw.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if raw.startswith(codecs.BOM_UTF16_LE) or raw.startswith(codecs.BOM_UTF16_BE):
+        return "utf-16"
+    if len(raw) >= 2:
+        if raw[0] and not raw[1]:
+            return "utf-16-le"
+        if not raw[0] and raw[1]:
+            return "utf-16-be"
+    return "utf-8"
+
+class _TextStream:
+    def __init__(self, f: BinaryIO, encoding: str, chunk_size: int):
+        self._file = f
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+    
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        self.eof = not chunk
+        self.buffer = self.buffer[self.pos:] + self._decoder.decode(chunk, final=self.eof)
+        self.pos = 0
+        return True
+    
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+    
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in descriptor stream, found {found or 'end of file'!r}")
+        self.pos += 1
+    
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _json_decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            if end == len(self.buffer) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+def _read_classes(stream: _TextStream, fields: Optional[AbstractSet[str]]) -> List[Dict[str, Any]]:
+    classes = []
+    stream.expect("[")
+    if stream.peek() == "]":
+        stream.pos += 1
+        return classes
+    
+    while True:
+        class_obj = stream.value()
+        if fields is not None and isinstance(class_obj, dict):
+            class_obj = {key: value for key, value in class_obj.items() if key in fields}
+        classes.append(class_obj)
+        
+        separator = stream.peek()
+        stream.pos += 1
+        if separator == "]":
+            return classes
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' in Classes array, found {separator or 'end of file'!r}")
+
+def _read_native_class(stream: _TextStream, fields: Optional[AbstractSet[str]]) -> Dict[str, Any]:
+    entry = {}
+    stream.expect("{")
+    if stream.peek() == "}":
+        stream.pos += 1
+        return entry
+    
+    while True:
+        key = stream.value()
+        stream.expect(":")
+        if key == "Classes" and stream.peek() == "[":
+            entry[key] = _read_classes(stream, fields)
+        else:
+            entry[key] = stream.value()
+        
+        separator = stream.peek()
+        stream.pos += 1
+        if separator == "}":
+            return entry
+        if separator != ",":
+            raise ValueError(f"Expected ',' or '}}' in NativeClass entry, found {separator or 'end of file'!r}")
+
+def iter_native_classes(
+    descriptor_file: Path,
+    fields: Optional[AbstractSet[str]] = None,
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[Dict[str, Any]]:
+    with open(descriptor_file, "rb") as f:
+        encoding = detect_encoding(f.read(4))
+        f.seek(0)
+        stream = _TextStream(f, encoding, chunk_size)
+        
+        stream.expect("[")
+        if stream.peek() == "]":
+            return
+        
+        while True:
+            yield _read_native_class(stream, fields)
+            
+            separator = stream.peek()
+            stream.pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or ']' between NativeClass entries, found {separator or 'end of file'!r}")
@@ -1,29 +1,354 @@
 import json
+import logging
+import multiprocessing
 import re
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import wraps
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Sequence, Tuple, Type
+from src.parsers.descriptor_diff import diff_datasets
+from src.parsers.description_index import DescriptionIndex
+from src.parsers.descriptor_index import DescriptorBlockIndex
+from src.parsers.descriptor_stream import detect_encoding, iter_native_classes
+from src.parsers.item_usage import ItemUsage
+from src.parsers.name_index import NAME_FIELDS, NameIndex
+from src.parsers.recipe_table import RecipeTable
+from src.parsers.search_index import TrigramIndex
+from src.parsers.records import (
+    Record, build_records, records_from_rows, records_to_rows, BeltRecord, BuildingRecord,
+    ConveyorMergerRecord, ConveyorSplitterRecord, DroneRecord, DroneStationRecord, FluidBufferRecord,
+    FreightPlatformRecord, ItemRecord, MilestoneRecord, MinerRecord, PipelinePumpRecord, PipelineRecord,
+    PowerGeneratorRecord, PowerPoleRecord, PowerStorageRecord, RailwayTrackRecord, RawResourceRecord,
+    RecipeRecord, ResourceNodeRecord, ResourceWellExtractorRecord, StorageContainerRecord,
+    TrainFreightCarRecord, TrainLocomotiveRecord, TrainSignalRecord, TrainStationRecord, TruckRecord,
+    TruckStationRecord, UnlockRecord, ValveRecord, WaterExtractorRecord
+)
+from src.parsers.symbols import SymbolTable
+from src.parsers.tech_tree import TechTree
+from src.parsers.unlock_index import NO_UNLOCK, UnlockIndex, UnlockInfo
+from src.parsers.snapshot import SnapshotError, descriptor_digest, read_snapshot, snapshot_path, write_snapshot
+from src.parsers.ue_struct import (
+    asset_name_from_path, class_name_from_path, parse_item_amounts, parse_named_floats, parse_object_paths
+)
+
+logger = logging.getLogger(__name__)
+
+def _cached_dataset(record_type: Type[Record]):
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self):
+            dataset = self._datasets.get(method.__name__)
+            if dataset is None:
+                dataset = self._datasets[method.__name__] = build_records(record_type, method(self))
+            return dataset
+        wrapper.record_type = record_type
+        return wrapper
+    return decorator
+
+_worker_parser: Optional["GameDescriptorParser"] = None
+
+def _init_extraction_worker(parser: "GameDescriptorParser"):
+    global _worker_parser
+    _worker_parser = parser
+
+def _extract_group(
+    method_names: Tuple[str, ...]
+) -> Tuple[Dict[str, List[Tuple[Any, ...]]], Dict[Tuple[str, str], Dict[str, Any]]]:
+    rows = {method_name: records_to_rows(getattr(_worker_parser, method_name)()) for method_name in method_names}
+    return rows, _worker_parser._derived_fallbacks
 
 class GameDescriptorParser:
-    def __init__(self, descriptor_file: Path):
+    PARSER_VERSION = 6
+    
+    CLASS_KIND_PREFIXES = {
+        "Recipe_": "recipe",
+        "Desc_": "descriptor",
+        "Build_": "buildable"
+    }
+    SCHEMATIC_KEYS = ("mType", "mUnlocks")
+    _RECIPE_UNLOCK_PATTERN = re.compile(r"Recipe_([^_]+)(?:_.+)?_C")
+    _PIPELINE_CAPACITY_PATTERN = re.compile(r'Capacity:\s*(\d+(?:[,\s]\d+)*)\s*m³')
+    _PUMP_HEAD_LIFT_PATTERN = re.compile(r'Maximum Head Lift:\s*(\d+(?:\.\d+)?)\s*m')
+    _FLUID_CAPACITY_PATTERN = re.compile(r'(\d+(?:[,\s]\d+)*)\s*m³')
+    CLASS_FIELDS = frozenset({
+        "ClassName", "FullName", "mDisplayName", "mDescription", "mType", "mTechTier", "mUnlocks", "mCost",
+        "mIngredients", "mProduct", "mProducedIn", "mManufactoringDuration",
+        "mVariablePowerConsumptionConstant", "mVariablePowerConsumptionFactor",
+        "mPowerConsumption", "mPowerConsumptionExponent", "mPowerProduction", "mPowerCapacity",
+        "mFuel", "mFuelConsumption", "mSupplementalToConsume", "mSupplementalLoadAmount",
+        "mExtractCycleTime", "mExtractStartupTime", "mItemsPerCycle", "mSpeed", "mStackSize",
+        "mInventorySize", "mMeshLength", "mDesignPressure"
+    })
+    
+    DATASET_EXTRACTORS = {
+        "miners": "extract_miners",
+        "belts": "extract_belts",
+        "raw_resources": "extract_raw_resources",
+        "resource_nodes": "extract_resource_nodes",
+        "recipes": "extract_recipes",
+        "buildings": "extract_buildings",
+        "items": "extract_all_items",
+        "pipelines": "extract_pipelines",
+        "pipeline_pumps": "extract_pipeline_pumps",
+        "train_stations": "extract_train_stations",
+        "truck_stations": "extract_truck_stations",
+        "drone_stations": "extract_drone_stations",
+        "train_locomotives": "extract_train_locomotives",
+        "train_freight_cars": "extract_train_freight_cars",
+        "trucks": "extract_trucks",
+        "drones": "extract_drones",
+        "freight_platforms": "extract_freight_platforms",
+        "railway_tracks": "extract_railway_tracks",
+        "train_signals": "extract_train_signals",
+        "power_generators": "extract_power_generators",
+        "power_storage": "extract_power_storage",
+        "power_poles": "extract_power_poles",
+        "conveyor_splitters": "extract_conveyor_splitters",
+        "conveyor_mergers": "extract_conveyor_mergers",
+        "storage_containers": "extract_storage_containers",
+        "fluid_buffers": "extract_fluid_buffers",
+        "valves": "extract_valves",
+        "water_extractors": "extract_water_extractors",
+        "resource_well_extractors": "extract_resource_well_extractors",
+        "milestones": "extract_milestones",
+        "unlocks": "extract_unlocks"
+    }
+    NAME_INDEX_FIELDS = {
+        "buildings": (*NAME_FIELDS, "building_type"),
+        "trucks": (*NAME_FIELDS, "vehicle_type"),
+        "train_signals": (*NAME_FIELDS, "signal_type"),
+        "power_generators": (*NAME_FIELDS, "generator_type"),
+        "conveyor_splitters": (*NAME_FIELDS, "splitter_type"),
+        "storage_containers": (*NAME_FIELDS, "container_type"),
+        "valves": (*NAME_FIELDS, "valve_type")
+    }
+    SEARCH_DATASETS = ("items", "recipes", "buildings")
+    DESCRIPTION_DATASETS = tuple(name for name in DATASET_EXTRACTORS if name not in ("resource_nodes", "recipes", "unlocks"))
+    EXTRACTOR_GROUPS = {
+        "recipes": ("extract_recipes", "extract_buildings"),
+        "items": (
+            "extract_all_items", "extract_raw_resources", "extract_resource_nodes", "extract_miners",
+            "extract_water_extractors", "extract_resource_well_extractors"
+        ),
+        "progression": ("extract_milestones", "extract_unlocks"),
+        "transportation": (
+            "extract_belts", "extract_pipelines", "extract_pipeline_pumps", "extract_train_stations",
+            "extract_truck_stations", "extract_drone_stations", "extract_train_locomotives",
+            "extract_train_freight_cars", "extract_trucks", "extract_drones", "extract_freight_platforms",
+            "extract_railway_tracks", "extract_train_signals"
+        ),
+        "power": ("extract_power_generators", "extract_power_storage", "extract_power_poles"),
+        "logistics": (
+            "extract_conveyor_splitters", "extract_conveyor_mergers", "extract_storage_containers",
+            "extract_fluid_buffers", "extract_valves"
+        )
+    }
+    
+    def __init__(
+        self,
+        descriptor_file: Path,
+        snapshot_dir: Optional[Path] = None,
+        streaming: bool = False,
+        lazy: bool = False,
+        overlay_files: Sequence[Path] = (),
+        workers: int = 0
+    ):
+        if lazy and (streaming or snapshot_dir is not None or overlay_files):
+            raise ValueError("Lazy loading cannot be combined with streaming, snapshot or overlay loading")
+        
         self.descriptor_file = descriptor_file
+        self.overlay_files: List[Path] = []
+        self.revision = 0
+        self.snapshot_dir = snapshot_dir
+        self.streaming = streaming
+        self.lazy = lazy
+        self.compiled = False
+        self._raw_lock = threading.Lock()
+        self._raw_parser: Optional["GameDescriptorParser"] = None
+        self._raw_users = 0
         self.data: List[Dict[str, Any]] = []
+        self._classes: List[Dict[str, Any]] = []
+        self._class_index: Dict[str, Dict[str, Any]] = {}
+        self._classes_by_kind: Dict[str, List[Dict[str, Any]]] = {}
+        self._datasets: Dict[str, List[Record]] = {}
+        self._derived_fallbacks: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._unlock_map: Optional[UnlockIndex] = None
+        self._recipe_table: Optional[RecipeTable] = None
+        self._item_usage: Optional[ItemUsage] = None
+        self._tech_tree: Optional[TechTree] = None
+        self._name_indexes: Dict[str, NameIndex] = {}
+        self._search_index: Optional[TrigramIndex] = None
+        self._description_index: Optional[DescriptionIndex] = None
+        self.symbols = SymbolTable()
+        self._block_index: Optional[DescriptorBlockIndex] = None
+        self._block_classes: Dict[int, List[Dict[str, Any]]] = {}
+        self._block_classes_by_kind: Dict[int, Dict[str, List[Dict[str, Any]]]] = {}
+        self.load_stats: Dict[str, Any] = {"source": "json", "encoding": None}
+        
+        start = time.perf_counter()
+        if lazy:
+            self._load_block_index()
+        elif snapshot_dir is None:
+            self._load_data()
+            self._classify_classes()
+        else:
+            self._load_with_snapshot(workers)
+        for overlay_file in overlay_files:
+            self.add_overlay(overlay_file)
+        self.load_stats["seconds"] = time.perf_counter() - start
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.update({"_raw_lock": None, "_raw_parser": None, "_raw_users": 0})
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._raw_lock = threading.Lock()
+    
+    def _load_with_snapshot(self, workers: int = 0):
+        if not self.descriptor_file.exists():
+            raise FileNotFoundError(f"Descriptor file not found: {self.descriptor_file}")
+        
+        digest = descriptor_digest(self.descriptor_file)
+        path = snapshot_path(self.snapshot_dir, self.descriptor_file, digest, self.PARSER_VERSION)
+        try:
+            payload = read_snapshot(path, digest, self.PARSER_VERSION)
+        except SnapshotError as e:
+            logger.warning(f"Ignoring descriptor snapshot: {e}")
+            payload = None
+        
+        if payload is not None:
+            self._classes = payload["classes"]
+            self._class_index = payload["class_index"]
+            self._classes_by_kind = payload["classes_by_kind"]
+            self._unlock_map = payload["unlock_map"]
+            self._datasets = payload["datasets"]
+            self._derived_fallbacks = payload["derived_fallbacks"]
+            self.symbols = payload["symbols"]
+            self.load_stats["source"] = "snapshot"
+            return
+        
         self._load_data()
+        self._classify_classes()
+        self.build_dataset(workers)
+        try:
+            write_snapshot(path, {
+                "digest": digest,
+                "parser_version": self.PARSER_VERSION,
+                "classes": self._classes,
+                "class_index": self._class_index,
+                "classes_by_kind": self._classes_by_kind,
+                "unlock_map": self._build_unlock_mapping(),
+                "datasets": self._datasets,
+                "derived_fallbacks": self._derived_fallbacks,
+                "symbols": self.symbols
+            })
+        except OSError as e:
+            logger.warning(f"Could not write descriptor snapshot {path}: {e}")
     
     def _load_data(self):
+        self.data, encoding = self._read_descriptor(self.descriptor_file)
+        if self.streaming:
+            self.load_stats["source"] = "json-stream"
+        self.load_stats["encoding"] = encoding
+    
+    def _read_descriptor(self, descriptor_file: Path) -> Tuple[List[Dict[str, Any]], str]:
+        if not descriptor_file.exists():
+            raise FileNotFoundError(f"Descriptor file not found: {descriptor_file}")
+        
+        if self.streaming:
+            return self._read_descriptor_streaming(descriptor_file)
+        
+        raw = descriptor_file.read_bytes()
+        encoding = detect_encoding(raw)
+        try:
+            text = raw.decode(encoding)
+        except UnicodeDecodeError:
+            encoding = "latin-1"
+            text = raw.decode(encoding)
+        del raw
+        
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Could not decode descriptor file {descriptor_file} as {encoding}: {e}") from e
+        if not isinstance(data, list):
+            raise ValueError(f"Descriptor file {descriptor_file} does not contain a list of NativeClass entries")
+        return data, encoding
+    
+    def _read_descriptor_streaming(self, descriptor_file: Path) -> Tuple[List[Dict[str, Any]], str]:
+        with open(descriptor_file, "rb") as f:
+            encoding = detect_encoding(f.read(4))
+        try:
+            return list(iter_native_classes(descriptor_file, self.CLASS_FIELDS)), encoding
+        except (UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"Could not stream descriptor file {descriptor_file} as {encoding}: {e}") from e
+    
+    def add_overlay(self, overlay_file: Path) -> int:
+        if self.lazy:
+            raise ValueError("Overlays cannot be added to a lazily loaded descriptor")
+        
+        self._restore_classes()
+        merged = self._merge_overlay(overlay_file)
+        self.overlay_files.append(overlay_file)
+        self._datasets = {}
+        self._derived_fallbacks = {}
+        self._unlock_map = None
+        self._recipe_table = None
+        self._item_usage = None
+        self._tech_tree = None
+        self._name_indexes = {}
+        self._search_index = None
+        self._description_index = None
+        self.revision += 1
+        logger.info(f"Merged {merged} classes from overlay {overlay_file} into {self.descriptor_file.name}")
+        return merged
+    
+    def _merge_overlay(self, overlay_file: Path) -> int:
+        data, _ = self._read_descriptor(overlay_file)
+        return self._merge_classes(class_obj for entry in data if "Classes" in entry for class_obj in entry["Classes"])
+    
+    def _merge_classes(self, classes: Iterable[Dict[str, Any]]) -> int:
+        positions: Dict[str, List[int]] = {}
+        for position, class_obj in enumerate(self._classes):
+            if "ClassName" in class_obj:
+                positions.setdefault(class_obj["ClassName"], []).append(position)
+        
+        merged = 0
+        for class_obj in classes:
+            class_name = class_obj.get("ClassName", "")
+            existing = self._class_index.get(class_name) if "ClassName" in class_obj else None
+            if existing is not None:
+                class_obj = {**existing, **class_obj}
+                for position in positions[class_name]:
+                    self._classes[position] = class_obj
+                self._class_index[class_name] = class_obj
+            else:
+                if "ClassName" in class_obj:
+                    self._class_index[class_name] = class_obj
+                    positions[class_name] = [len(self._classes)]
+                self._classes.append(class_obj)
+            merged += 1
+        
+        self._classes_by_kind = {kind: [] for kind in self.CLASS_KIND_PREFIXES.values()}
+        self._classes_by_kind["schematic"] = []
+        for class_obj in self._classes:
+            for kind in self._class_kinds(class_obj, class_obj.get("ClassName", "")):
+                self._classes_by_kind[kind].append(class_obj)
+        return merged
+    
+    def _load_block_index(self):
         if not self.descriptor_file.exists():
             raise FileNotFoundError(f"Descriptor file not found: {self.descriptor_file}")
         
-        encodings = ['utf-16-le', 'utf-16', 'utf-8', 'utf-8-sig', 'latin-1']
-        for encoding in encodings:
-            try:
-                with open(self.descriptor_file, 'r', encoding=encoding) as f:
-                    self.data = json.load(f)
-                if isinstance(self.data, list):
-                    return
-            except (UnicodeDecodeError, json.JSONDecodeError):
-                continue
-        
-        raise ValueError(f"Could not decode descriptor file {self.descriptor_file} with any supported encoding")
+        self._block_index, encoding = DescriptorBlockIndex.from_file(self.descriptor_file, self.SCHEMATIC_KEYS)
+        self.load_stats["source"] = "json-lazy"
+        self.load_stats["encoding"] = encoding
     
     def _parse_float(self, value: str) -> float:
         try:
@@ -37,10 +362,10 @@ class GameDescriptorParser:
         except (ValueError, TypeError):
             return 0
     
-    def _extract_number_from_text(self, text: str, pattern: str, default: float = 0.0) -> float:
+    def _extract_number_from_text(self, text: str, pattern: re.Pattern, default: Optional[float] = 0.0) -> Optional[float]:
         if not text:
             return default
-        match = re.search(pattern, text)
+        match = pattern.search(text)
         if match:
             try:
                 return float(match.group(1).replace(',', '').replace(' ', ''))
@@ -48,14 +373,239 @@ class GameDescriptorParser:
                 pass
         return default
     
-    def _get_class_by_name(self, class_name_pattern: str) -> Optional[Dict[str, Any]]:
-        pattern = re.compile(class_name_pattern)
+    def _derived_number(self, dataset: str, class_name: str, field: str, text: str, pattern: re.Pattern, default: float) -> float:
+        value = self._extract_number_from_text(text, pattern, None)
+        if value is None:
+            self._note_fallback(dataset, class_name, field, default, "default")
+            return default
+        self._derived_fallbacks.pop((class_name, field), None)
+        return value
+    
+    def _note_fallback(self, dataset: str, class_name: str, field: str, value: float, source: str):
+        self._derived_fallbacks[(class_name, field)] = {
+            "dataset": dataset,
+            "class_name": class_name,
+            "field": field,
+            "value": value,
+            "source": source
+        }
+    
+    def derived_fallbacks(self) -> List[Dict[str, Any]]:
+        return list(self._derived_fallbacks.values())
+    
+    def _class_kinds(self, class_obj: Dict[str, Any], class_name: str) -> List[str]:
+        kinds = []
+        for prefix, kind in self.CLASS_KIND_PREFIXES.items():
+            if class_name.startswith(prefix):
+                kinds.append(kind)
+                break
+        
+        if any(key in class_obj for key in self.SCHEMATIC_KEYS):
+            kinds.append("schematic")
+        return kinds
+    
+    def _classify_classes(self):
+        self._classes = []
+        self._class_index = {}
+        self._classes_by_kind = {kind: [] for kind in self.CLASS_KIND_PREFIXES.values()}
+        self._classes_by_kind["schematic"] = []
+        
         for entry in self.data:
             if "Classes" in entry:
                 for class_obj in entry["Classes"]:
-                    if "ClassName" in class_obj and pattern.match(class_obj["ClassName"]):
-                        return class_obj
-        return None
+                    self._classes.append(class_obj)
+                    class_name = class_obj.get("ClassName", "")
+                    if "ClassName" in class_obj:
+                        self._class_index.setdefault(class_name, class_obj)
+                    
+                    for kind in self._class_kinds(class_obj, class_name):
+                        self._classes_by_kind[kind].append(class_obj)
+    
+    def _classify_block(self, block_id: int, classes: List[Dict[str, Any]]):
+        block_kinds = {}
+        for class_obj in classes:
+            class_name = class_obj.get("ClassName", "")
+            if "ClassName" in class_obj and class_name not in self._class_index:
+                if self._block_index.first_block_by_class.get(class_name) == block_id:
+                    self._class_index[class_name] = class_obj
+            
+            for kind in self._class_kinds(class_obj, class_name):
+                block_kinds.setdefault(kind, []).append(class_obj)
+        
+        self._block_classes[block_id] = classes
+        self._block_classes_by_kind[block_id] = block_kinds
+    
+    def _load_blocks(self, block_ids: List[int]):
+        self._block_index.load_blocks(block_ids, self._classify_block)
+    
+    def compile(self, workers: int = 0):
+        if self.lazy or self.compiled:
+            return
+        
+        start = time.perf_counter()
+        self.build_dataset(workers)
+        self._build_unlock_mapping()
+        self.recipe_table()
+        self.item_usage()
+        self.tech_tree()
+        for dataset in self.DATASET_EXTRACTORS:
+            self.name_index(dataset)
+        self.search_index()
+        self.description_index()
+        self.data = []
+        self._classes = []
+        self._class_index = {}
+        self._classes_by_kind = {}
+        self.compiled = True
+        logger.info(f"Compiled {self.descriptor_file.name} and released the raw descriptor in {(time.perf_counter() - start) * 1000:.1f} ms")
+    
+    def _restore_classes(self):
+        with self._raw_lock:
+            if not self.compiled:
+                return
+            logger.info(f"Reloading raw descriptor classes of {self.descriptor_file.name} to rebuild the dataset")
+            self.data, _ = self._read_descriptor(self.descriptor_file)
+            self._classify_classes()
+            for overlay_file in self.overlay_files:
+                self._merge_overlay(overlay_file)
+            self.compiled = False
+    
+    @contextmanager
+    def _raw_access(self) -> Iterator["GameDescriptorParser"]:
+        if not self.compiled:
+            yield self
+            return
+        
+        with self._raw_lock:
+            if self._raw_parser is None:
+                logger.info(f"Reading raw descriptor classes of {self.descriptor_file.name} for on-demand access")
+                self._raw_parser = GameDescriptorParser(self.descriptor_file, streaming=self.streaming, overlay_files=self.overlay_files)
+            raw_parser = self._raw_parser
+            self._raw_users += 1
+        try:
+            yield raw_parser
+        finally:
+            with self._raw_lock:
+                self._raw_users -= 1
+                if not self._raw_users:
+                    self._raw_parser = None
+    
+    def _get_all_classes(self) -> List[Dict[str, Any]]:
+        if self.compiled:
+            with self._raw_access() as raw_parser:
+                return raw_parser._get_all_classes()
+        if self._block_index is not None and not self._classes:
+            self._block_index.load_all(self._classify_block)
+            self._classes = [
+                class_obj for block_id in range(len(self._block_index.blocks)) for class_obj in self._block_classes[block_id]
+            ]
+        return self._classes
+    
+    def _get_classes_of_kind(self, kind: str) -> List[Dict[str, Any]]:
+        if self.compiled:
+            with self._raw_access() as raw_parser:
+                return raw_parser._get_classes_of_kind(kind)
+        if self._block_index is not None and kind not in self._classes_by_kind:
+            if kind == "schematic":
+                block_ids = self._block_index.blocks_with_schematic_keys()
+            else:
+                prefixes = [prefix for prefix, prefix_kind in self.CLASS_KIND_PREFIXES.items() if prefix_kind == kind]
+                block_ids = sorted({block_id for prefix in prefixes for block_id in self._block_index.blocks_with_class_prefix(prefix)})
+            self._load_blocks(block_ids)
+            self._classes_by_kind[kind] = [
+                class_obj for block_id in block_ids for class_obj in self._block_classes_by_kind[block_id].get(kind, [])
+            ]
+        return self._classes_by_kind.get(kind, [])
+    
+    def build_dataset(self, workers: int = 0) -> Dict[str, List[Record]]:
+        if workers > 1 and not self.lazy:
+            self._build_dataset_parallel(workers)
+        return {name: getattr(self, method)() for name, method in self.DATASET_EXTRACTORS.items()}
+    
+    def _build_dataset_parallel(self, workers: int):
+        groups = [
+            tuple(method_name for method_name in method_names if method_name not in self._datasets)
+            for method_names in self.EXTRACTOR_GROUPS.values()
+        ]
+        groups = [method_names for method_names in groups if method_names]
+        if not groups:
+            return
+        if threading.current_thread() is not threading.main_thread():
+            logger.warning("Extracting datasets in-process because worker processes can only be started from the main thread")
+            return
+        
+        start = time.perf_counter()
+        start_methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in start_methods else None)
+        with ProcessPoolExecutor(min(workers, len(groups)), context, _init_extraction_worker, (self,)) as executor:
+            results = list(executor.map(_extract_group, groups))
+        
+        for rows_by_method, derived_fallbacks in results:
+            self._derived_fallbacks.update(derived_fallbacks)
+            for method_name, rows in rows_by_method.items():
+                self._datasets[method_name] = records_from_rows(getattr(type(self), method_name).record_type, rows)
+        logger.info(f"Extracted {len(groups)} dataset groups with {workers} worker processes in {(time.perf_counter() - start) * 1000:.1f} ms")
+    
+    def diff(self, other: "GameDescriptorParser") -> Dict[str, Dict[str, Any]]:
+        return diff_datasets(self.build_dataset(), other.build_dataset())
+    
+    def share_unchanged(self, reference: "GameDescriptorParser") -> int:
+        if self.lazy or reference.lazy:
+            return 0
+        
+        replacements = {}
+        for class_name, class_obj in self._class_index.items():
+            shared = reference._class_index.get(class_name)
+            if shared is not None and shared is not class_obj and shared == class_obj:
+                replacements[id(class_obj)] = shared
+        
+        if replacements:
+            def swap(classes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                return [replacements.get(id(class_obj), class_obj) for class_obj in classes]
+            
+            self._classes = swap(self._classes)
+            self._class_index = {name: replacements.get(id(class_obj), class_obj) for name, class_obj in self._class_index.items()}
+            self._classes_by_kind = {kind: swap(classes) for kind, classes in self._classes_by_kind.items()}
+            for entry in self.data:
+                if "Classes" in entry:
+                    entry["Classes"] = swap(entry["Classes"])
+        
+        shared_records = 0
+        for method_name, records in self._datasets.items():
+            reference_records = {
+                record.get("class_name"): record
+                for record in reference._datasets.get(method_name, [])
+                if record.get("class_name")
+            }
+            for i, record in enumerate(records):
+                shared = reference_records.get(record.get("class_name"))
+                if shared is not None and shared is not record and shared == record:
+                    records[i] = shared
+                    shared_records += 1
+        
+        return len(replacements) + shared_records
+    
+    def _get_class_by_name(self, class_name: str) -> Optional[Dict[str, Any]]:
+        if self.compiled:
+            with self._raw_access() as raw_parser:
+                return raw_parser._get_class_by_name(class_name)
+        if self._block_index is not None and class_name not in self._class_index:
+            block_id = self._block_index.first_block_by_class.get(class_name)
+            if block_id is None:
+                return None
+            self._load_blocks([block_id])
+        return self._class_index.get(class_name)
+    
+    def _find_classes_by_pattern(self, class_name_pattern: str) -> List[Dict[str, Any]]:
+        if self.compiled:
+            with self._raw_access() as raw_parser:
+                return raw_parser._find_classes_by_pattern(class_name_pattern)
+        pattern = re.compile(class_name_pattern)
+        if self._block_index is not None:
+            class_names = [class_name for class_name in self._block_index.first_block_by_class if pattern.match(class_name)]
+            self._load_blocks(sorted({self._block_index.first_block_by_class[class_name] for class_name in class_names}))
+            return [self._class_index[class_name] for class_name in class_names if class_name in self._class_index]
+        return [class_obj for class_name, class_obj in self._class_index.items() if pattern.match(class_name)]
     
     def _get_display_info(self, desc_class_name: str) -> Dict[str, str]:
         desc_class = self._get_class_by_name(desc_class_name)
@@ -66,7 +616,8 @@ class GameDescriptorParser:
             }
         return {"display_name": "", "description": ""}
     
-    def extract_miners(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(MinerRecord)
+    def extract_miners(self) -> List[MinerRecord]:
         miners = []
         for mk in [1, 2, 3]:
             build_class_name = f"Build_MinerMk{mk}_C"
@@ -91,7 +642,8 @@ class GameDescriptorParser:
         
         return miners
     
-    def extract_belts(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(BeltRecord)
+    def extract_belts(self) -> List[BeltRecord]:
         belts = []
         for mk in [1, 2, 3, 4, 5, 6]:
             build_class_name = f"Build_ConveyorBeltMk{mk}_C"
@@ -112,7 +664,8 @@ class GameDescriptorParser:
         
         return belts
     
-    def extract_raw_resources(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(RawResourceRecord)
+    def extract_raw_resources(self) -> List[RawResourceRecord]:
         raw_resources = []
         resource_patterns = [
             r"Desc_(OreIron|OreCopper|OreGold|OreBauxite|OreUranium)_C",
@@ -120,32 +673,24 @@ class GameDescriptorParser:
             r"Desc_(CrudeOil|LiquidOil)_C"
         ]
         
-        seen_resources = set()
-        
-        for entry in self.data:
-            if "Classes" in entry:
-                for class_obj in entry["Classes"]:
-                    class_name = class_obj.get("ClassName", "")
-                    
-                    for pattern in resource_patterns:
-                        if re.match(pattern, class_name) and class_name not in seen_resources:
-                            seen_resources.add(class_name)
-                            
-                            resource_type = class_name.replace("Desc_", "").replace("_C", "")
-                            resource_type = re.sub(r'([A-Z])', r' \1', resource_type).strip()
-                            
-                            raw_resource = {
-                                "class_name": class_name,
-                                "display_name": class_obj.get("mDisplayName", ""),
-                                "description": class_obj.get("mDescription", ""),
-                                "resource_type": resource_type
-                            }
-                            raw_resources.append(raw_resource)
-                            break
+        for class_obj in self._find_classes_by_pattern("|".join(f"(?:{pattern})" for pattern in resource_patterns)):
+            class_name = class_obj["ClassName"]
+            
+            resource_type = class_name.replace("Desc_", "").replace("_C", "")
+            resource_type = re.sub(r'([A-Z])', r' \1', resource_type).strip()
+            
+            raw_resource = {
+                "class_name": class_name,
+                "display_name": class_obj.get("mDisplayName", ""),
+                "description": class_obj.get("mDescription", ""),
+                "resource_type": resource_type
+            }
+            raw_resources.append(raw_resource)
         
         return raw_resources
     
-    def extract_resource_nodes(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(ResourceNodeRecord)
+    def extract_resource_nodes(self) -> List[ResourceNodeRecord]:
         resource_nodes = []
         
         purity_multipliers = {
@@ -175,36 +720,30 @@ class GameDescriptorParser:
         return resource_nodes
     
     def _parse_recipe_items(self, items_str: str) -> List[Dict[str, Any]]:
-        if not items_str or items_str == "":
-            return []
-        
         items = []
-        pattern = r'ItemClass="([^"]+)"[^A]*Amount=(\d+)'
-        matches = re.findall(pattern, items_str)
-        
-        for item_class, amount in matches:
-            items.append({
-                "item_class": item_class,
-                "amount": self._parse_int(amount)
-            })
-        
+        for item in parse_item_amounts(items_str):
+            item_class = self.symbols.path(self.symbols.intern(item.item_class))
+            items.append({"item_class": item_class, "amount": item.amount})
         return items
     
     def _parse_produced_in(self, produced_in_str: str) -> List[str]:
-        if not produced_in_str or produced_in_str == "":
-            return []
-        
         buildings = []
-        pattern = r'"([^"]+Build_[^"]+)"'
-        matches = re.findall(pattern, produced_in_str)
-        
-        for match in matches:
-            building_match = re.search(r'Build_(\w+)\.Build_\w+_C', match)
-            if building_match:
-                buildings.append(building_match.group(1))
+        for path in parse_object_paths(produced_in_str):
+            asset_name = asset_name_from_path(path)
+            if asset_name.startswith("Build_"):
+                buildings.append(sys.intern(asset_name[len("Build_"):]))
         
         return buildings
     
+    def _parse_class_names(self, paths_str: str, prefix: str = "") -> List[str]:
+        class_names = []
+        for path in parse_object_paths(paths_str):
+            class_name = class_name_from_path(path)
+            if class_name.endswith("_C") and class_name.startswith(prefix):
+                class_names.append(class_name)
+        
+        return class_names
+    
     def _is_alternate_recipe(self, class_name: str, full_name: str, display_name: str) -> bool:
         if "Recipe_Alternate_" in class_name:
             return True
@@ -214,45 +753,76 @@ class GameDescriptorParser:
             return True
         return False
     
-    def extract_recipes(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(RecipeRecord)
+    def extract_recipes(self) -> List[RecipeRecord]:
         recipes = []
         
-        for entry in self.data:
-            if "Classes" in entry:
-                for class_obj in entry["Classes"]:
-                    class_name = class_obj.get("ClassName", "")
-                    if class_name.startswith("Recipe_") and class_name != "Recipe_Pattern_" and not class_name.endswith("_Icon_C"):
-                        full_name = class_obj.get("FullName", "")
-                        display_name = class_obj.get("mDisplayName", "N/A")
-                        
-                        if display_name == "N/A":
-                            continue
-                        
-                        ingredients_str = class_obj.get("mIngredients", "")
-                        product_str = class_obj.get("mProduct", "")
-                        produced_in_str = class_obj.get("mProducedIn", "")
-                        
-                        ingredients = self._parse_recipe_items(ingredients_str)
-                        products = self._parse_recipe_items(product_str)
-                        produced_in = self._parse_produced_in(produced_in_str)
-                        
-                        if ingredients or products:
-                            recipe = {
-                                "class_name": class_name,
-                                "display_name": display_name,
-                                "is_alternate": self._is_alternate_recipe(class_name, full_name, display_name),
-                                "ingredients": ingredients,
-                                "products": products,
-                                "manufacturing_duration": self._parse_float(class_obj.get("mManufactoringDuration", "0")),
-                                "produced_in": produced_in,
-                                "variable_power_consumption_constant": self._parse_float(class_obj.get("mVariablePowerConsumptionConstant", "0")) if class_obj.get("mVariablePowerConsumptionConstant") else None,
-                                "variable_power_consumption_factor": self._parse_float(class_obj.get("mVariablePowerConsumptionFactor", "0")) if class_obj.get("mVariablePowerConsumptionFactor") else None
-                            }
-                            recipes.append(recipe)
+        for class_obj in self._get_classes_of_kind("recipe"):
+            class_name = class_obj.get("ClassName", "")
+            if class_name != "Recipe_Pattern_" and not class_name.endswith("_Icon_C"):
+                full_name = class_obj.get("FullName", "")
+                display_name = class_obj.get("mDisplayName", "N/A")
+                
+                if display_name == "N/A":
+                    continue
+                
+                ingredients_str = class_obj.get("mIngredients", "")
+                product_str = class_obj.get("mProduct", "")
+                produced_in_str = class_obj.get("mProducedIn", "")
+                
+                ingredients = self._parse_recipe_items(ingredients_str)
+                products = self._parse_recipe_items(product_str)
+                produced_in = self._parse_produced_in(produced_in_str)
+                
+                if ingredients or products:
+                    recipe = {
+                        "class_name": class_name,
+                        "display_name": display_name,
+                        "is_alternate": self._is_alternate_recipe(class_name, full_name, display_name),
+                        "ingredients": ingredients,
+                        "products": products,
+                        "manufacturing_duration": self._parse_float(class_obj.get("mManufactoringDuration", "0")),
+                        "produced_in": produced_in,
+                        "variable_power_consumption_constant": self._parse_float(class_obj.get("mVariablePowerConsumptionConstant", "0")) if class_obj.get("mVariablePowerConsumptionConstant") else None,
+                        "variable_power_consumption_factor": self._parse_float(class_obj.get("mVariablePowerConsumptionFactor", "0")) if class_obj.get("mVariablePowerConsumptionFactor") else None
+                    }
+                    recipes.append(recipe)
         
         return recipes
     
-    def extract_buildings(self) -> List[Dict[str, Any]]:
+    def recipe_table(self) -> RecipeTable:
+        if self._recipe_table is None:
+            self._recipe_table = RecipeTable(self.extract_recipes(), self.symbols)
+        return self._recipe_table
+    
+    def item_usage(self) -> ItemUsage:
+        if self._item_usage is None:
+            self._item_usage = ItemUsage(self.recipe_table(), self.symbols)
+        return self._item_usage
+    
+    def name_index(self, dataset: str) -> NameIndex:
+        index = self._name_indexes.get(dataset)
+        if index is None:
+            records = getattr(self, self.DATASET_EXTRACTORS[dataset])()
+            index = self._name_indexes[dataset] = NameIndex(records, self.NAME_INDEX_FIELDS.get(dataset, NAME_FIELDS))
+        return index
+    
+    def search_index(self) -> TrigramIndex:
+        if self._search_index is None:
+            self._search_index = TrigramIndex({
+                dataset: getattr(self, self.DATASET_EXTRACTORS[dataset])() for dataset in self.SEARCH_DATASETS
+            })
+        return self._search_index
+    
+    def description_index(self) -> DescriptionIndex:
+        if self._description_index is None:
+            self._description_index = DescriptionIndex({
+                dataset: getattr(self, self.DATASET_EXTRACTORS[dataset])() for dataset in self.DESCRIPTION_DATASETS
+            })
+        return self._description_index
+    
+    @_cached_dataset(BuildingRecord)
+    def extract_buildings(self) -> List[BuildingRecord]:
         buildings = []
         unlock_map = self._build_unlock_mapping()
         building_types = [
@@ -290,7 +860,8 @@ class GameDescriptorParser:
         
         return buildings
     
-    def extract_all_items(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(ItemRecord)
+    def extract_all_items(self) -> List[ItemRecord]:
         items = []
         excluded_prefixes = [
             "Desc_ConveyorBeltMk",
@@ -303,37 +874,36 @@ class GameDescriptorParser:
             "Desc_Swatch_"
         ]
         
-        for entry in self.data:
-            if "Classes" in entry:
-                for class_obj in entry["Classes"]:
-                    class_name = class_obj.get("ClassName", "")
-                    
-                    if class_name.startswith("Desc_") and not any(class_name.startswith(prefix) for prefix in excluded_prefixes):
-                        display_name = class_obj.get("mDisplayName", "")
-                        
-                        if not display_name or display_name == "N/A":
-                            continue
-                        
-                        item_type = "component"
-                        if "RawResources" in class_obj.get("FullName", ""):
-                            item_type = "raw_resource"
-                        elif "Equipment" in class_obj.get("FullName", ""):
-                            item_type = "equipment"
-                        elif any(building in class_obj.get("FullName", "") for building in ["Buildable", "Factory"]):
-                            item_type = "building_part"
-                        
-                        item = {
-                            "class_name": class_name,
-                            "display_name": display_name,
-                            "description": class_obj.get("mDescription", ""),
-                            "item_type": item_type,
-                            "stack_size": class_obj.get("mStackSize") if class_obj.get("mStackSize") else None
-                        }
-                        items.append(item)
+        for class_obj in self._get_classes_of_kind("descriptor"):
+            class_name = class_obj.get("ClassName", "")
+            
+            if not any(class_name.startswith(prefix) for prefix in excluded_prefixes):
+                display_name = class_obj.get("mDisplayName", "")
+                
+                if not display_name or display_name == "N/A":
+                    continue
+                
+                item_type = "component"
+                if "RawResources" in class_obj.get("FullName", ""):
+                    item_type = "raw_resource"
+                elif "Equipment" in class_obj.get("FullName", ""):
+                    item_type = "equipment"
+                elif any(building in class_obj.get("FullName", "") for building in ["Buildable", "Factory"]):
+                    item_type = "building_part"
+                
+                item = {
+                    "class_name": class_name,
+                    "display_name": display_name,
+                    "description": class_obj.get("mDescription", ""),
+                    "item_type": item_type,
+                    "stack_size": class_obj.get("mStackSize") if class_obj.get("mStackSize") else None
+                }
+                items.append(item)
         
         return items
     
-    def extract_pipelines(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(PipelineRecord)
+    def extract_pipelines(self) -> List[PipelineRecord]:
         pipelines = []
         for mk in [1, 2]:
             if mk == 1:
@@ -349,9 +919,12 @@ class GameDescriptorParser:
                 display_info = self._get_display_info(desc_class_name)
                 description = build_class.get("mDescription") or display_info.get("description", "")
                 
-                flow_rate = self._extract_number_from_text(
-                    description, 
-                    r'Capacity:\s*(\d+(?:[,\s]\d+)*)\s*m³',
+                flow_rate = self._derived_number(
+                    "pipelines",
+                    build_class_name,
+                    "flow_rate",
+                    description,
+                    self._PIPELINE_CAPACITY_PATTERN,
                     300.0 if mk == 1 else 600.0
                 )
                 
@@ -366,7 +939,8 @@ class GameDescriptorParser:
         
         return pipelines
     
-    def extract_pipeline_pumps(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(PipelinePumpRecord)
+    def extract_pipeline_pumps(self) -> List[PipelinePumpRecord]:
         pumps = []
         for mk in [1, 2]:
             if mk == 1:
@@ -384,9 +958,12 @@ class GameDescriptorParser:
                 display_info = self._get_display_info(desc_class_name)
                 description = build_class.get("mDescription") or display_info.get("description", "")
                 
-                head_lift = self._extract_number_from_text(
+                head_lift = self._derived_number(
+                    "pipeline_pumps",
+                    build_class_name,
+                    "head_lift",
                     description,
-                    r'Maximum Head Lift:\s*(\d+(?:\.\d+)?)\s*m',
+                    self._PUMP_HEAD_LIFT_PATTERN,
                     default_head_lift
                 )
                 
@@ -394,6 +971,8 @@ class GameDescriptorParser:
                     design_pressure = self._parse_float(build_class.get("mDesignPressure", "0"))
                     if design_pressure > 0:
                         head_lift = design_pressure
+                        if (build_class_name, "head_lift") in self._derived_fallbacks:
+                            self._note_fallback("pipeline_pumps", build_class_name, "head_lift", head_lift, "mDesignPressure")
                 
                 pump_data = {
                     "mk": mk,
@@ -408,7 +987,8 @@ class GameDescriptorParser:
         
         return pumps
     
-    def extract_train_stations(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(TrainStationRecord)
+    def extract_train_stations(self) -> List[TrainStationRecord]:
         stations = []
         station_configs = [
             ("Build_TrainStation_C", "Desc_TrainStation_C", "solid", 100),
@@ -439,7 +1019,8 @@ class GameDescriptorParser:
         
         return stations
     
-    def extract_truck_stations(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(TruckStationRecord)
+    def extract_truck_stations(self) -> List[TruckStationRecord]:
         stations = []
         build_class_name = "Build_TruckStation_C"
         desc_class_name = "Desc_TruckStation_C"
@@ -460,7 +1041,8 @@ class GameDescriptorParser:
         
         return stations
     
-    def extract_drone_stations(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(DroneStationRecord)
+    def extract_drone_stations(self) -> List[DroneStationRecord]:
         stations = []
         build_class_name = "Build_DroneStation_C"
         desc_class_name = "Desc_DroneStation_C"
@@ -484,18 +1066,16 @@ class GameDescriptorParser:
         return stations
     
     def _parse_power_consumption_range(self, power_str: str) -> Dict[str, float]:
-        if not power_str or power_str == "":
-            return {"min": 0.0, "max": 0.0}
-        
-        match = re.search(r'Min=([0-9.]+).*Max=([0-9.]+)', power_str)
-        if match:
+        power_range = parse_named_floats(power_str)
+        if "Min" in power_range and "Max" in power_range:
             return {
-                "min": self._parse_float(match.group(1)),
-                "max": self._parse_float(match.group(2))
+                "min": power_range["Min"],
+                "max": power_range["Max"]
             }
         return {"min": 0.0, "max": 0.0}
     
-    def extract_train_locomotives(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(TrainLocomotiveRecord)
+    def extract_train_locomotives(self) -> List[TrainLocomotiveRecord]:
         locomotives = []
         desc_class_name = "Desc_Locomotive_C"
         desc_class = self._get_class_by_name(desc_class_name)
@@ -516,7 +1096,8 @@ class GameDescriptorParser:
         
         return locomotives
     
-    def extract_train_freight_cars(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(TrainFreightCarRecord)
+    def extract_train_freight_cars(self) -> List[TrainFreightCarRecord]:
         freight_cars = []
         desc_class_name = "Desc_FreightWagon_C"
         desc_class = self._get_class_by_name(desc_class_name)
@@ -525,9 +1106,12 @@ class GameDescriptorParser:
             storage_slots = self._parse_int(desc_class.get("mInventorySize", "32"))
             description = desc_class.get("mDescription", "")
             
-            fluid_capacity = self._extract_number_from_text(
+            fluid_capacity = self._derived_number(
+                "train_freight_cars",
+                desc_class_name,
+                "fluid_capacity_m3",
                 description,
-                r'(\d+(?:[,\s]\d+)*)\s*m³',
+                self._FLUID_CAPACITY_PATTERN,
                 1600.0
             )
             
@@ -543,7 +1127,8 @@ class GameDescriptorParser:
         
         return freight_cars
     
-    def extract_trucks(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(TruckRecord)
+    def extract_trucks(self) -> List[TruckRecord]:
         trucks = []
         vehicle_configs = [
             ("Desc_Truck_C", "Truck"),
@@ -571,7 +1156,8 @@ class GameDescriptorParser:
         
         return trucks
     
-    def extract_drones(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(DroneRecord)
+    def extract_drones(self) -> List[DroneRecord]:
         drones = []
         desc_class_name = "Desc_DroneTransport_C"
         desc_class = self._get_class_by_name(desc_class_name)
@@ -592,7 +1178,8 @@ class GameDescriptorParser:
         
         return drones
     
-    def extract_freight_platforms(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(FreightPlatformRecord)
+    def extract_freight_platforms(self) -> List[FreightPlatformRecord]:
         platforms = []
         build_class_name = "Build_FreightPlatform_C"
         desc_class_name = "Desc_FreightPlatform_C"
@@ -615,7 +1202,8 @@ class GameDescriptorParser:
         
         return platforms
     
-    def extract_power_generators(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(PowerGeneratorRecord)
+    def extract_power_generators(self) -> List[PowerGeneratorRecord]:
         generators = []
         unlock_map = self._build_unlock_mapping()
         generator_configs = [
@@ -658,7 +1246,8 @@ class GameDescriptorParser:
         
         return generators
     
-    def extract_power_storage(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(PowerStorageRecord)
+    def extract_power_storage(self) -> List[PowerStorageRecord]:
         storage = []
         unlock_map = self._build_unlock_mapping()
         build_class_name = "Build_PowerStorage_C"
@@ -688,7 +1277,8 @@ class GameDescriptorParser:
         
         return storage
     
-    def extract_power_poles(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(PowerPoleRecord)
+    def extract_power_poles(self) -> List[PowerPoleRecord]:
         poles = []
         pole_configs = [
             (1, "Build_PowerPoleMk1_C", "Desc_PowerPoleMk1_C", 4),
@@ -714,7 +1304,8 @@ class GameDescriptorParser:
         
         return poles
     
-    def extract_conveyor_splitters(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(ConveyorSplitterRecord)
+    def extract_conveyor_splitters(self) -> List[ConveyorSplitterRecord]:
         splitters = []
         unlock_map = self._build_unlock_mapping()
         splitter_configs = [
@@ -745,7 +1336,8 @@ class GameDescriptorParser:
         
         return splitters
     
-    def extract_conveyor_mergers(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(ConveyorMergerRecord)
+    def extract_conveyor_mergers(self) -> List[ConveyorMergerRecord]:
         mergers = []
         unlock_map = self._build_unlock_mapping()
         build_class_name = "Build_ConveyorMerger_C"
@@ -771,7 +1363,8 @@ class GameDescriptorParser:
         
         return mergers
     
-    def extract_storage_containers(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(StorageContainerRecord)
+    def extract_storage_containers(self) -> List[StorageContainerRecord]:
         containers = []
         unlock_map = self._build_unlock_mapping()
         container_configs = [
@@ -803,7 +1396,8 @@ class GameDescriptorParser:
         
         return containers
     
-    def extract_fluid_buffers(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(FluidBufferRecord)
+    def extract_fluid_buffers(self) -> List[FluidBufferRecord]:
         buffers = []
         unlock_map = self._build_unlock_mapping()
         buffer_configs = [
@@ -837,7 +1431,8 @@ class GameDescriptorParser:
         
         return buffers
     
-    def extract_valves(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(ValveRecord)
+    def extract_valves(self) -> List[ValveRecord]:
         valves = []
         unlock_map = self._build_unlock_mapping()
         valve_configs = [
@@ -866,7 +1461,8 @@ class GameDescriptorParser:
         
         return valves
     
-    def extract_water_extractors(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(WaterExtractorRecord)
+    def extract_water_extractors(self) -> List[WaterExtractorRecord]:
         extractors = []
         build_class_name = "Build_WaterPump_C"
         desc_class_name = "Desc_WaterPump_C"
@@ -890,7 +1486,8 @@ class GameDescriptorParser:
         
         return extractors
     
-    def extract_resource_well_extractors(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(ResourceWellExtractorRecord)
+    def extract_resource_well_extractors(self) -> List[ResourceWellExtractorRecord]:
         extractors = []
         well_configs = [
             ("Build_ResourceExtractor_C", "Desc_ResourceExtractor_C", "Oil"),
@@ -919,101 +1516,67 @@ class GameDescriptorParser:
         return extractors
     
     def _parse_cost_items(self, cost_str: str) -> List[Dict[str, Any]]:
-        if not cost_str or cost_str == "":
-            return []
-        
-        cost_items = []
-        pattern = r'ItemClass="([^"]+)"[^A]*Amount=(\d+)'
-        matches = re.findall(pattern, cost_str)
-        
-        for item_class, amount in matches:
-            cost_items.append({
-                "item_class": item_class,
-                "amount": self._parse_int(amount)
-            })
-        
-        return cost_items
+        return [{"item_class": item.item_class, "amount": item.amount} for item in parse_item_amounts(cost_str)]
     
     def _parse_recipe_unlocks(self, recipes_str: str) -> List[str]:
-        if not recipes_str or recipes_str == "":
-            return []
-        
-        recipes = []
-        pattern = r'Recipe_([^.\']+)\.Recipe_([^.\']+)_C'
-        matches = re.findall(pattern, recipes_str)
-        
-        for match in matches:
-            recipe_name = f"Recipe_{match[1]}_C"
-            recipes.append(recipe_name)
-        
-        return recipes
+        return self._parse_class_names(recipes_str, "Recipe_")
     
-    def extract_milestones(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(MilestoneRecord)
+    def extract_milestones(self) -> List[MilestoneRecord]:
         milestones = []
         
-        for entry in self.data:
-            if "Classes" in entry:
-                for class_obj in entry["Classes"]:
-                    schematic_type = class_obj.get("mType", "")
-                    
-                    if schematic_type == "EST_Milestone":
-                        tier = self._parse_int(class_obj.get("mTechTier", "0"))
-                        phase = tier if tier > 0 else 0
-                        
-                        cost = self._parse_cost_items(class_obj.get("mCost", ""))
-                        
-                        milestone_data = {
-                            "class_name": class_obj.get("ClassName", ""),
-                            "display_name": class_obj.get("mDisplayName", ""),
-                            "description": class_obj.get("mDescription", ""),
-                            "tier": tier,
-                            "phase": phase,
-                            "cost": cost if cost else None
-                        }
-                        milestones.append(milestone_data)
+        for class_obj in self._get_classes_of_kind("schematic"):
+            schematic_type = class_obj.get("mType", "")
+            
+            if schematic_type == "EST_Milestone":
+                tier = self._parse_int(class_obj.get("mTechTier", "0"))
+                phase = tier if tier > 0 else 0
+                
+                cost = self._parse_cost_items(class_obj.get("mCost", ""))
+                
+                milestone_data = {
+                    "class_name": class_obj.get("ClassName", ""),
+                    "display_name": class_obj.get("mDisplayName", ""),
+                    "description": class_obj.get("mDescription", ""),
+                    "tier": tier,
+                    "phase": phase,
+                    "cost": cost if cost else None
+                }
+                milestones.append(milestone_data)
         
         return milestones
     
-    def _build_unlock_mapping(self) -> Dict[str, Dict[str, Any]]:
-        unlock_map = {}
+    def _build_unlock_mapping(self) -> UnlockIndex:
+        if self._unlock_map is not None:
+            return self._unlock_map
         
-        for entry in self.data:
-            if "Classes" in entry:
-                for class_obj in entry["Classes"]:
-                    schematic_type = class_obj.get("mType", "")
-                    tier = self._parse_int(class_obj.get("mTechTier", "0"))
-                    milestone_name = class_obj.get("mDisplayName", "")
-                    unlocks = class_obj.get("mUnlocks", [])
+        unlock_map = UnlockIndex()
+        
+        for class_obj in self._get_classes_of_kind("schematic"):
+            schematic_type = class_obj.get("mType", "")
+            tier = self._parse_int(class_obj.get("mTechTier", "0"))
+            milestone_name = class_obj.get("mDisplayName", "")
+            unlocks = class_obj.get("mUnlocks", [])
+            
+            for unlock_obj in unlocks:
+                unlock_class = unlock_obj.get("Class", "")
+                
+                if unlock_class == "BP_UnlockRecipe_C":
+                    recipes_str = unlock_obj.get("mRecipes", "")
+                    recipe_list = self._parse_recipe_unlocks(recipes_str)
                     
-                    for unlock_obj in unlocks:
-                        unlock_class = unlock_obj.get("Class", "")
-                        
-                        if unlock_class == "BP_UnlockRecipe_C":
-                            recipes_str = unlock_obj.get("mRecipes", "")
-                            recipe_list = self._parse_recipe_unlocks(recipes_str)
-                            
-                            for recipe in recipe_list:
-                                if recipe not in unlock_map:
-                                    unlock_map[recipe] = {
-                                        "tier": tier if tier > 0 else None,
-                                        "milestone": milestone_name if milestone_name else None,
-                                        "unlock_type": "recipe"
-                                    }
-                        
-                        elif unlock_class == "BP_UnlockSchematic_C":
-                            schematics_str = unlock_obj.get("mSchematics", "")
-                            pattern = r'([^./]+)\.([^.\']+)_C'
-                            matches = re.findall(pattern, schematics_str)
-                            
-                            for match in matches:
-                                schematic_name = f"{match[1]}_C"
-                                if schematic_name not in unlock_map:
-                                    unlock_map[schematic_name] = {
-                                        "tier": tier if tier > 0 else None,
-                                        "milestone": milestone_name if milestone_name else None,
-                                        "unlock_type": "schematic"
-                                    }
+                    for recipe in recipe_list:
+                        unlock_map.add(recipe, tier if tier > 0 else None, milestone_name if milestone_name else None, "recipe")
+                
+                elif unlock_class == "BP_UnlockSchematic_C":
+                    schematics_str = unlock_obj.get("mSchematics", "")
+                    
+                    for schematic_name in self._parse_class_names(schematics_str):
+                        unlock_map.add(
+                            schematic_name, tier if tier > 0 else None, milestone_name if milestone_name else None, "schematic"
+                        )
         
+        self._unlock_map = unlock_map
         return unlock_map
     
     def _get_building_class_from_recipe(self, recipe_class_name: str) -> Optional[str]:
@@ -1053,33 +1616,31 @@ class GameDescriptorParser:
         
         return None
     
-    def _get_unlock_info(self, class_name: str, unlock_map: Dict[str, Dict[str, Any]]) -> Dict[str, Optional[Any]]:
-        recipe_patterns = [
-            r"Recipe_([^_]+)(?:_.+)?_C",
-            r"Recipe_([^_]+)_C"
-        ]
+    def _get_unlock_info(self, class_name: str, unlock_map: UnlockIndex) -> UnlockInfo:
+        info = unlock_map.resolved(class_name)
+        if info is not None:
+            return info
         
-        for pattern in recipe_patterns:
-            match = re.match(pattern, class_name)
-            if match:
-                recipe_name = f"Recipe_{match.group(1)}"
-                if recipe_name in unlock_map:
-                    return unlock_map[recipe_name]
-                
-                building_class = self._get_building_class_from_recipe(class_name)
-                if building_class and building_class in unlock_map:
-                    return unlock_map[building_class]
+        match = self._RECIPE_UNLOCK_PATTERN.match(class_name)
+        if match:
+            recipe_name = f"Recipe_{match.group(1)}"
+            if recipe_name in unlock_map:
+                return unlock_map.remember(class_name, unlock_map[recipe_name])
+            
+            building_class = self._get_building_class_from_recipe(class_name)
+            if building_class and building_class in unlock_map:
+                return unlock_map.remember(class_name, unlock_map[building_class])
         
         if class_name in unlock_map:
-            return unlock_map[class_name]
-        
-        for key, value in unlock_map.items():
-            if class_name in key or key in class_name:
-                return value
+            return unlock_map.remember(class_name, unlock_map[class_name])
         
-        return {"tier": None, "milestone": None, "unlock_type": None}
+        return unlock_map.remember(class_name, unlock_map.first_overlapping(class_name) or NO_UNLOCK)
+    
+    def classes_unlocked_by(self, milestone: str) -> List[str]:
+        return self._build_unlock_mapping().classes_unlocked_by(milestone)
     
-    def extract_railway_tracks(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(RailwayTrackRecord)
+    def extract_railway_tracks(self) -> List[RailwayTrackRecord]:
         tracks = []
         build_class_name = "Build_RailroadTrack_C"
         desc_class_name = "Desc_RailroadTrack_C"
@@ -1101,7 +1662,8 @@ class GameDescriptorParser:
         
         return tracks
     
-    def extract_train_signals(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(TrainSignalRecord)
+    def extract_train_signals(self) -> List[TrainSignalRecord]:
         signals = []
         signal_configs = [
             ("Desc_RailroadBlockSignal_C", "Block Signal"),
@@ -1125,63 +1687,64 @@ class GameDescriptorParser:
         
         return signals
     
-    def extract_unlocks(self) -> List[Dict[str, Any]]:
+    @_cached_dataset(UnlockRecord)
+    def extract_unlocks(self) -> List[UnlockRecord]:
         unlocks = []
         unlock_map = self._build_unlock_mapping()
         
         seen_unlocks = set()
         
-        for entry in self.data:
-            if "Classes" in entry:
-                for class_obj in entry["Classes"]:
-                    class_name = class_obj.get("ClassName", "")
+        for class_obj in self._get_all_classes():
+            class_name = class_obj.get("ClassName", "")
+            
+            unlock_info = self._get_unlock_info(class_name, unlock_map)
+            
+            if unlock_info.get("unlock_type"):
+                if class_name not in seen_unlocks:
+                    seen_unlocks.add(class_name)
                     
-                    unlock_info = self._get_unlock_info(class_name, unlock_map)
+                    unlock_data = {
+                        "class_name": class_name,
+                        "display_name": class_obj.get("mDisplayName", ""),
+                        "unlock_type": unlock_info.get("unlock_type", "unknown"),
+                        "tier": unlock_info.get("tier"),
+                        "milestone": unlock_info.get("milestone"),
+                        "mam_research": None
+                    }
+                    unlocks.append(unlock_data)
+            
+            unlocks_list = class_obj.get("mUnlocks", [])
+            for unlock_obj in unlocks_list:
+                unlock_class = unlock_obj.get("Class", "")
+                
+                if unlock_class == "BP_UnlockBuildable_C":
+                    buildables_str = unlock_obj.get("mBuildables", "")
                     
-                    if unlock_info.get("unlock_type"):
-                        if class_name not in seen_unlocks:
-                            seen_unlocks.add(class_name)
+                    for buildable_name in self._parse_class_names(buildables_str):
+                        if buildable_name not in seen_unlocks:
+                            seen_unlocks.add(buildable_name)
+                            
+                            buildable_info = self._get_unlock_info(buildable_name, unlock_map)
+                            tier = self._parse_int(class_obj.get("mTechTier", "0"))
+                            milestone_name = class_obj.get("mDisplayName", "")
+                            
+                            buildable_class = self._get_class_by_name(buildable_name)
+                            display_name = buildable_class.get("mDisplayName", "") if buildable_class else ""
                             
                             unlock_data = {
-                                "class_name": class_name,
-                                "display_name": class_obj.get("mDisplayName", ""),
-                                "unlock_type": unlock_info.get("unlock_type", "unknown"),
-                                "tier": unlock_info.get("tier"),
-                                "milestone": unlock_info.get("milestone"),
+                                "class_name": buildable_name,
+                                "display_name": display_name,
+                                "unlock_type": "building",
+                                "tier": tier if tier > 0 else buildable_info.get("tier"),
+                                "milestone": milestone_name if milestone_name else buildable_info.get("milestone"),
                                 "mam_research": None
                             }
                             unlocks.append(unlock_data)
-                    
-                    unlocks_list = class_obj.get("mUnlocks", [])
-                    for unlock_obj in unlocks_list:
-                        unlock_class = unlock_obj.get("Class", "")
-                        
-                        if unlock_class == "BP_UnlockBuildable_C":
-                            buildables_str = unlock_obj.get("mBuildables", "")
-                            pattern = r'([^./]+)\.([^.\']+)_C'
-                            matches = re.findall(pattern, buildables_str)
-                            
-                            for match in matches:
-                                buildable_name = f"{match[1]}_C"
-                                if buildable_name not in seen_unlocks:
-                                    seen_unlocks.add(buildable_name)
-                                    
-                                    buildable_info = self._get_unlock_info(buildable_name, unlock_map)
-                                    tier = self._parse_int(class_obj.get("mTechTier", "0"))
-                                    milestone_name = class_obj.get("mDisplayName", "")
-                                    
-                                    buildable_class = self._get_class_by_name(buildable_name)
-                                    display_name = buildable_class.get("mDisplayName", "") if buildable_class else ""
-                                    
-                                    unlock_data = {
-                                        "class_name": buildable_name,
-                                        "display_name": display_name,
-                                        "unlock_type": "building",
-                                        "tier": tier if tier > 0 else buildable_info.get("tier"),
-                                        "milestone": milestone_name if milestone_name else buildable_info.get("milestone"),
-                                        "mam_research": None
-                                    }
-                                    unlocks.append(unlock_data)
         
         return unlocks
+    
+    def tech_tree(self) -> TechTree:
+        if self._tech_tree is None:
+            self._tech_tree = TechTree(self.extract_unlocks())
+        return self._tech_tree
 
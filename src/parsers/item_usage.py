@@ -0,0 +1,28 @@
+from typing import Dict
+from src.parsers.recipe_table import RecipeTable
+from src.parsers.symbols import SymbolTable
+
+class ItemUsage:
+    def __init__(self, recipe_table: RecipeTable, symbols: SymbolTable):
+        self.recipe_table = recipe_table
+        self.symbols = symbols
+        self._producers: Dict[str, int] = {}
+        self._consumers: Dict[str, int] = {}
+        
+        for symbol_id, item_class in enumerate(symbols.short_names):
+            producers = recipe_table.producing((symbol_id,))
+            if producers:
+                self._producers[item_class] = self._producers.get(item_class, 0) | producers
+            consumers = recipe_table.consuming((symbol_id,))
+            if consumers:
+                self._consumers[item_class] = self._consumers.get(item_class, 0) | consumers
+    
+    def _class_name(self, item_class: str) -> str:
+        symbol_id = self.symbols.id_of(item_class)
+        return item_class if symbol_id is None else self.symbols.short_name(symbol_id)
+    
+    def produced_by(self, item_class: str) -> int:
+        return self._producers.get(self._class_name(item_class), 0)
+    
+    def used_in(self, item_class: str) -> int:
+        return self._consumers.get(self._class_name(item_class), 0)
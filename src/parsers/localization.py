@@ -0,0 +1,137 @@
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from src.parsers.description_index import DescriptionIndex
+from src.parsers.descriptor_stream import iter_native_classes
+from src.parsers.game_descriptor_parser import GameDescriptorParser
+from src.parsers.name_index import NAME_FIELDS, NameIndex
+from src.parsers.recipe_table import RecipeTable
+from src.parsers.records import Record
+from src.parsers.search_index import TrigramIndex
+from src.parsers.tech_tree import TechTree
+
+LOCALE_FILE_PATTERN = re.compile(r"^[a-z]{2,3}(?:-[A-Za-z0-9]{2,8})*\.json$")
+LOCALIZED_CLASS_FIELDS = ("mDisplayName", "mDescription")
+LOCALIZED_RECORD_FIELDS = frozenset({"display_name", "description", "milestone"})
+
+def discover_locale_files(descriptor_file: Path) -> Dict[str, Path]:
+    locale_files = {}
+    if descriptor_file.parent.is_dir():
+        for candidate in sorted(descriptor_file.parent.iterdir()):
+            if candidate != descriptor_file and candidate.is_file() and LOCALE_FILE_PATTERN.match(candidate.name):
+                locale_files[candidate.stem] = candidate
+    return locale_files
+
+class LocaleStrings:
+    def __init__(self, locale: str, translations: Dict[str, str]):
+        self.locale = locale
+        self.translations = translations
+    
+    @classmethod
+    def from_file(cls, locale: str, locale_file: Path, base: GameDescriptorParser) -> "LocaleStrings":
+        translations = {}
+        fields = frozenset({"ClassName", *LOCALIZED_CLASS_FIELDS})
+        with base._raw_access() as raw_base:
+            for entry in iter_native_classes(locale_file, fields):
+                for class_obj in entry.get("Classes", []):
+                    base_class = raw_base._get_class_by_name(class_obj.get("ClassName", ""))
+                    if base_class is None:
+                        continue
+                    for field in LOCALIZED_CLASS_FIELDS:
+                        source = base_class.get(field)
+                        translated = class_obj.get(field)
+                        if source and translated and source != translated:
+                            translations.setdefault(source, translated)
+        return cls(locale, translations)
+    
+    def translate(self, value: Any) -> Any:
+        if isinstance(value, str):
+            return self.translations.get(value, value)
+        return value
+    
+    def localize(self, record: Record) -> Record:
+        values = tuple(
+            self.translate(getattr(record, name)) if name in LOCALIZED_RECORD_FIELDS else getattr(record, name)
+            for name in record.__slots__
+        )
+        if all(value is getattr(record, name) for name, value in zip(record.__slots__, values)):
+            return record
+        return type(record)._from_values(values)
+
+class LocalizedParser:
+    def __init__(self, base: GameDescriptorParser, strings: LocaleStrings):
+        self.base = base
+        self.strings = strings
+        self.locale = strings.locale
+        self._lock = threading.Lock()
+        self._clear_caches()
+    
+    def _clear_caches(self):
+        self._revision = self.base.revision
+        self._datasets: Dict[str, List[Record]] = {}
+        self._recipe_table: Optional[RecipeTable] = None
+        self._tech_tree: Optional[TechTree] = None
+        self._name_indexes: Dict[str, NameIndex] = {}
+        self._search_index: Optional[TrigramIndex] = None
+        self._description_index: Optional[DescriptionIndex] = None
+    
+    def _check_revision(self):
+        if self._revision != self.base.revision:
+            self._clear_caches()
+    
+    def __getattr__(self, name: str) -> Any:
+        method_name = name if name in self.base.DATASET_EXTRACTORS.values() else None
+        if method_name is None:
+            return getattr(self.base, name)
+        return lambda: self._localized(method_name)
+    
+    def _localized(self, method_name: str) -> List[Record]:
+        self._check_revision()
+        records = self._datasets.get(method_name)
+        if records is None:
+            with self._lock:
+                records = self._datasets.get(method_name)
+                if records is None:
+                    records = [self.strings.localize(record) for record in getattr(self.base, method_name)()]
+                    self._datasets[method_name] = records
+        return records
+    
+    def build_dataset(self) -> Dict[str, List[Record]]:
+        return {name: self._localized(method) for name, method in self.base.DATASET_EXTRACTORS.items()}
+    
+    def recipe_table(self) -> RecipeTable:
+        self._check_revision()
+        if self._recipe_table is None:
+            self._recipe_table = RecipeTable(self._localized("extract_recipes"), self.base.symbols)
+        return self._recipe_table
+    
+    def name_index(self, dataset: str) -> NameIndex:
+        self._check_revision()
+        index = self._name_indexes.get(dataset)
+        if index is None:
+            records = self._localized(self.base.DATASET_EXTRACTORS[dataset])
+            index = self._name_indexes[dataset] = NameIndex(records, self.base.NAME_INDEX_FIELDS.get(dataset, NAME_FIELDS))
+        return index
+    
+    def search_index(self) -> TrigramIndex:
+        self._check_revision()
+        if self._search_index is None:
+            self._search_index = TrigramIndex({
+                dataset: self._localized(self.base.DATASET_EXTRACTORS[dataset]) for dataset in self.base.SEARCH_DATASETS
+            })
+        return self._search_index
+    
+    def description_index(self) -> DescriptionIndex:
+        self._check_revision()
+        if self._description_index is None:
+            self._description_index = DescriptionIndex({
+                dataset: self._localized(self.base.DATASET_EXTRACTORS[dataset]) for dataset in self.base.DESCRIPTION_DATASETS
+            })
+        return self._description_index
+    
+    def tech_tree(self) -> TechTree:
+        self._check_revision()
+        if self._tech_tree is None:
+            self._tech_tree = TechTree(self._localized("extract_unlocks"))
+        return self._tech_tree
@@ -0,0 +1,18 @@
+from typing import Iterable, Iterator, List, Sequence, TypeVar
+
+RowT = TypeVar("RowT")
+
+def mask_rows(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+def select_rows(rows: Sequence[RowT], mask: int) -> List[RowT]:
+    return [rows[row] for row in mask_rows(mask)]
+
+def rows_mask(rows: Iterable[int], size: int) -> int:
+    bits = bytearray((size + 7) // 8)
+    for row in rows:
+        bits[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(bits, "little")
@@ -0,0 +1,60 @@
+import re
+from typing import Dict, Generic, Optional, Sequence, TypeVar
+from src.parsers.records import Record
+
+RecordT = TypeVar("RecordT", bound=Record)
+
+NAME_FIELDS = ("class_name", "display_name")
+MAX_CACHED_LOOKUPS = 4096
+_CLASS_AFFIXES = re.compile(r"^(?:Build|Desc|Recipe|Schematic|BP)_|_C$")
+
+def class_stem(class_name: str) -> str:
+    return _CLASS_AFFIXES.sub("", class_name)
+
+def name_key(name: str) -> str:
+    return "".join(char for char in name.casefold() if char.isalnum())
+
+class NameIndex(Generic[RecordT]):
+    def __init__(self, records: Sequence[RecordT], fields: Sequence[str] = NAME_FIELDS):
+        self.records = records
+        self._exact: Dict[str, int] = {}
+        self._aliases: Dict[str, int] = {}
+        self._lookups: Dict[str, Optional[int]] = {}
+        
+        for row, record in enumerate(records):
+            for field in fields:
+                value = record.get(field)
+                if not isinstance(value, str) or not value:
+                    continue
+                self._exact.setdefault(value.lower(), row)
+                self._add_alias(value, row)
+                if field == "class_name":
+                    self._add_alias(class_stem(value), row)
+    
+    def _add_alias(self, value: str, row: int):
+        key = name_key(value)
+        if key:
+            self._aliases.setdefault(key, row)
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def row_of(self, name: str) -> Optional[int]:
+        if name in self._lookups:
+            return self._lookups[name]
+        
+        lowered = name.lower()
+        row = self._exact.get(lowered)
+        if row is None:
+            row = self._exact.get(lowered.replace("-", " "))
+        if row is None:
+            row = self._aliases.get(name_key(name))
+        
+        if len(self._lookups) >= MAX_CACHED_LOOKUPS:
+            self._lookups.clear()
+        self._lookups[name] = row
+        return row
+    
+    def find(self, name: str) -> Optional[RecordT]:
+        row = self.row_of(name)
+        return self.records[row] if row is not None else None
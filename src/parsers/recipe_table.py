@@ -0,0 +1,61 @@
+from typing import Dict, Iterable, Iterator, List, Optional
+from src.parsers.masks import mask_rows, rows_mask, select_rows
+from src.parsers.name_index import NameIndex
+from src.parsers.records import RecipeRecord
+from src.parsers.symbols import SymbolTable
+
+class RecipeTable:
+    def __init__(self, recipes: List[RecipeRecord], symbols: SymbolTable):
+        self.recipes = recipes
+        size = len(recipes)
+        self.all_mask = (1 << size) - 1
+        self.names = NameIndex(recipes)
+        
+        alternate_rows: List[int] = []
+        building_rows: Dict[str, List[int]] = {}
+        ingredient_rows: Dict[int, List[int]] = {}
+        product_rows: Dict[int, List[int]] = {}
+        for row, recipe in enumerate(recipes):
+            if recipe.is_alternate:
+                alternate_rows.append(row)
+            for building in recipe.produced_in:
+                building_rows.setdefault(building, []).append(row)
+            for ingredient in recipe.ingredients:
+                ingredient_rows.setdefault(symbols.intern(ingredient.item_class), []).append(row)
+            for product in recipe.products:
+                product_rows.setdefault(symbols.intern(product.item_class), []).append(row)
+        
+        self.alternate_mask = rows_mask(alternate_rows, size)
+        self._building_masks = {building: rows_mask(rows, size) for building, rows in building_rows.items()}
+        self._ingredient_masks = {item_id: rows_mask(rows, size) for item_id, rows in ingredient_rows.items()}
+        self._product_masks = {item_id: rows_mask(rows, size) for item_id, rows in product_rows.items()}
+    
+    def __len__(self) -> int:
+        return len(self.recipes)
+    
+    def alternate(self, is_alternate: bool) -> int:
+        return self.alternate_mask if is_alternate else self.all_mask & ~self.alternate_mask
+    
+    def produced_in(self, building: str) -> int:
+        return self._building_masks.get(building, 0)
+    
+    def producing(self, item_ids: Iterable[int]) -> int:
+        mask = 0
+        for item_id in item_ids:
+            mask |= self._product_masks.get(item_id, 0)
+        return mask
+    
+    def consuming(self, item_ids: Iterable[int]) -> int:
+        mask = 0
+        for item_id in item_ids:
+            mask |= self._ingredient_masks.get(item_id, 0)
+        return mask
+    
+    def find(self, name: str) -> Optional[RecipeRecord]:
+        return self.names.find(name)
+    
+    def rows(self, mask: int) -> Iterator[int]:
+        return mask_rows(mask)
+    
+    def select(self, mask: int) -> List[RecipeRecord]:
+        return select_rows(self.recipes, mask)
@@ -0,0 +1,225 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Type, TypeVar
+
+RecordT = TypeVar("RecordT", bound="Record")
+
+class Record(Mapping):
+    __slots__ = ()
+    _nested: Dict[str, Type["Record"]] = {}
+
+    def __init__(self, **values: Any):
+        unknown = values.keys() - set(self.__slots__)
+        if unknown:
+            raise TypeError(f"{type(self).__name__} got unexpected fields: {', '.join(sorted(unknown))}")
+        for name in self.__slots__:
+            object.__setattr__(self, name, self._freeze(name, values.get(name)))
+
+    @classmethod
+    def _freeze(cls, name: str, value: Any) -> Any:
+        nested = cls._nested.get(name)
+        if isinstance(value, list):
+            if nested is not None:
+                return tuple(item if isinstance(item, nested) else nested(**item) for item in value)
+            return tuple(value)
+        if nested is not None and isinstance(value, dict):
+            return nested(**value)
+        return value
+
+    @classmethod
+    def _from_values(cls: Type[RecordT], values: Tuple[Any, ...]) -> RecordT:
+        record = cls.__new__(cls)
+        for name, value in zip(cls.__slots__, values):
+            object.__setattr__(record, name, value)
+        return record
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def _row(self) -> Tuple[Any, ...]:
+        if not self._nested:
+            return tuple(getattr(self, name) for name in self.__slots__)
+        return tuple(
+            tuple(item._row() for item in getattr(self, name))
+            if name in self._nested and isinstance(getattr(self, name), tuple) else getattr(self, name)
+            for name in self.__slots__
+        )
+
+    @classmethod
+    def _from_row(cls: Type[RecordT], row: Tuple[Any, ...]) -> RecordT:
+        if not cls._nested:
+            return cls._from_values(row)
+        return cls._from_values(tuple(
+            tuple(cls._nested[name]._from_row(item) for item in value)
+            if name in cls._nested and isinstance(value, tuple) else value
+            for name, value in zip(cls.__slots__, row)
+        ))
+
+    def __reduce__(self):
+        return type(self)._from_values, (tuple(getattr(self, name) for name in self.__slots__),)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+def build_records(record_type: Type[RecordT], rows: Iterable[Dict[str, Any]]) -> List[RecordT]:
+    return [row if isinstance(row, record_type) else record_type(**row) for row in rows]
+
+def records_to_rows(records: Iterable[Record]) -> List[Tuple[Any, ...]]:
+    return [record._row() for record in records]
+
+def records_from_rows(record_type: Type[RecordT], rows: Iterable[Tuple[Any, ...]]) -> List[RecordT]:
+    return [record_type._from_row(row) for row in rows]
+
+class ItemAmountRecord(Record):
+    __slots__ = ("item_class", "amount")
+
+class CostItemRecord(Record):
+    __slots__ = ("item_class", "amount")
+
+class MinerRecord(Record):
+    __slots__ = (
+        "mk", "class_name", "display_name", "description", "extract_cycle_time", "items_per_cycle",
+        "power_consumption", "power_consumption_exponent", "extract_startup_time"
+    )
+
+class BeltRecord(Record):
+    __slots__ = ("mk", "class_name", "display_name", "description", "speed")
+
+class RawResourceRecord(Record):
+    __slots__ = ("class_name", "display_name", "description", "resource_type")
+
+class ResourceNodeRecord(Record):
+    __slots__ = ("resource_type", "purity", "multiplier", "display_name")
+
+class RecipeRecord(Record):
+    __slots__ = (
+        "class_name", "display_name", "is_alternate", "ingredients", "products", "manufacturing_duration",
+        "produced_in", "variable_power_consumption_constant", "variable_power_consumption_factor"
+    )
+    _nested = {"ingredients": ItemAmountRecord, "products": ItemAmountRecord}
+
+class BuildingRecord(Record):
+    __slots__ = (
+        "class_name", "display_name", "description", "building_type", "power_consumption",
+        "power_consumption_exponent", "tier_unlocked", "milestone"
+    )
+
+class ItemRecord(Record):
+    __slots__ = ("class_name", "display_name", "description", "item_type", "stack_size")
+
+class PipelineRecord(Record):
+    __slots__ = ("mk", "class_name", "display_name", "description", "flow_rate")
+
+class PipelinePumpRecord(Record):
+    __slots__ = ("mk", "class_name", "display_name", "description", "power_consumption", "head_lift", "flow_rate")
+
+class TrainStationRecord(Record):
+    __slots__ = ("class_name", "display_name", "description", "power_consumption", "platform_count", "station_type")
+
+class TruckStationRecord(Record):
+    __slots__ = ("class_name", "display_name", "description", "power_consumption", "input_output_rate")
+
+class DroneStationRecord(Record):
+    __slots__ = (
+        "class_name", "display_name", "description", "power_consumption", "drone_capacity", "charging_rate",
+        "throughput_rate"
+    )
+
+class TrainLocomotiveRecord(Record):
+    __slots__ = (
+        "class_name", "display_name", "description", "power_consumption_min", "power_consumption_max",
+        "power_consumption"
+    )
+
+class TrainFreightCarRecord(Record):
+    __slots__ = ("class_name", "display_name", "description", "storage_slots", "fluid_capacity_m3", "throughput_rate")
+
+class TruckRecord(Record):
+    __slots__ = (
+        "class_name", "display_name", "description", "vehicle_type", "storage_slots", "fuel_consumption_rate",
+        "max_speed", "tier_unlocked"
+    )
+
+class DroneRecord(Record):
+    __slots__ = ("class_name", "display_name", "description", "cargo_slots", "battery_capacity", "max_speed", "range_limit")
+
+class FreightPlatformRecord(Record):
+    __slots__ = ("class_name", "display_name", "description", "power_consumption", "storage_slots", "input_rate", "output_rate")
+
+class RailwayTrackRecord(Record):
+    __slots__ = ("class_name", "display_name", "description", "mesh_length", "power_transmission", "connection_limit")
+
+class TrainSignalRecord(Record):
+    __slots__ = ("class_name", "display_name", "description", "signal_type", "power_consumption", "range")
+
+class PowerGeneratorRecord(Record):
+    __slots__ = (
+        "class_name", "display_name", "description", "generator_type", "power_output", "power_consumption",
+        "fuel_types", "fuel_consumption_rate", "water_consumption_rate", "tier_unlocked", "milestone"
+    )
+
+class PowerStorageRecord(Record):
+    __slots__ = (
+        "class_name", "display_name", "description", "capacity", "charge_rate", "discharge_rate", "efficiency",
+        "tier_unlocked", "milestone"
+    )
+
+class PowerPoleRecord(Record):
+    __slots__ = ("mk", "class_name", "display_name", "description", "connection_limit", "power_transmission")
+
+class ConveyorSplitterRecord(Record):
+    __slots__ = (
+        "class_name", "display_name", "description", "splitter_type", "output_count", "throughput_capacity",
+        "tier_unlocked", "milestone"
+    )
+
+class ConveyorMergerRecord(Record):
+    __slots__ = (
+        "class_name", "display_name", "description", "input_count", "throughput_capacity", "tier_unlocked", "milestone"
+    )
+
+class StorageContainerRecord(Record):
+    __slots__ = (
+        "class_name", "display_name", "description", "container_type", "storage_slots", "input_rate", "output_rate",
+        "tier_unlocked", "milestone"
+    )
+
+class FluidBufferRecord(Record):
+    __slots__ = (
+        "class_name", "display_name", "description", "capacity", "input_rate", "output_rate", "tier_unlocked", "milestone"
+    )
+
+class ValveRecord(Record):
+    __slots__ = ("class_name", "display_name", "description", "valve_type", "max_flow_rate", "tier_unlocked", "milestone")
+
+class WaterExtractorRecord(Record):
+    __slots__ = (
+        "class_name", "display_name", "description", "extraction_rate", "power_consumption", "power_consumption_exponent"
+    )
+
+class ResourceWellExtractorRecord(Record):
+    __slots__ = (
+        "class_name", "display_name", "description", "resource_type", "extraction_rate", "power_consumption",
+        "pressure_requirement"
+    )
+
+class MilestoneRecord(Record):
+    __slots__ = ("class_name", "display_name", "description", "tier", "phase", "cost")
+    _nested = {"cost": CostItemRecord}
+
+class UnlockRecord(Record):
+    __slots__ = ("class_name", "display_name", "unlock_type", "tier", "milestone", "mam_research")
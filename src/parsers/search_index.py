@@ -0,0 +1,91 @@
+import math
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from src.parsers.masks import mask_rows, rows_mask
+from src.parsers.name_index import class_stem
+from src.parsers.records import Record
+
+MIN_COVERAGE = 0.5
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z])(?=[A-Z0-9])|(?<=[A-Z])(?=[A-Z][a-z])")
+
+def search_words(text: str) -> List[str]:
+    return _WORD_PATTERN.findall(text.casefold())
+
+def _split_class_name(class_name: str) -> str:
+    return _CAMEL_BOUNDARY.sub(" ", class_stem(class_name))
+
+def trigrams(words: Sequence[str]) -> Set[str]:
+    grams = set()
+    for word in words:
+        padded = "  " + word
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+def _count_equals(planes: List[int], count: int, candidates: int) -> int:
+    if count >> len(planes):
+        return 0
+    mask = candidates
+    for bit, plane in enumerate(planes):
+        mask &= plane if count >> bit & 1 else ~plane
+    return mask
+
+class TrigramIndex:
+    def __init__(self, datasets: Dict[str, Sequence[Record]]):
+        self.datasets = datasets
+        names = []
+        for order, (dataset, records) in enumerate(datasets.items()):
+            for row, record in enumerate(records):
+                for text in (record.display_name, _split_class_name(record.class_name)):
+                    words = search_words(text or "")
+                    if words:
+                        names.append((sum(map(len, words)), order, row, dataset, words))
+        names.sort(key=lambda name: name[:3])
+        
+        self.entries: List[Tuple[str, int]] = []
+        postings: Dict[str, List[int]] = {}
+        dataset_entries: Dict[str, List[int]] = {dataset: [] for dataset in datasets}
+        for entry_id, (_, _, row, dataset, words) in enumerate(names):
+            self.entries.append((dataset, row))
+            dataset_entries[dataset].append(entry_id)
+            for gram in trigrams(words):
+                postings.setdefault(gram, []).append(entry_id)
+        
+        size = len(self.entries)
+        self._postings = {gram: rows_mask(entry_ids, size) for gram, entry_ids in postings.items()}
+        self._dataset_masks = {dataset: rows_mask(entry_ids, size) for dataset, entry_ids in dataset_entries.items()}
+        self.all_mask = (1 << size) - 1
+    
+    def search(self, query: str, dataset: Optional[str] = None, limit: int = 10) -> List[Tuple[str, Record, float]]:
+        grams = trigrams(search_words(_split_class_name(query)))
+        if not grams or limit <= 0:
+            return []
+        
+        scope = self._dataset_masks.get(dataset, 0) if dataset else self.all_mask
+        planes: List[int] = []
+        for gram in grams:
+            carry = self._postings.get(gram, 0) & scope
+            for bit, plane in enumerate(planes):
+                if not carry:
+                    break
+                planes[bit], carry = plane ^ carry, plane & carry
+            if carry:
+                planes.append(carry)
+        
+        candidates = 0
+        for plane in planes:
+            candidates |= plane
+        
+        hits = []
+        seen = set()
+        for count in range(len(grams), math.ceil(len(grams) * MIN_COVERAGE) - 1, -1):
+            for entry_id in mask_rows(_count_equals(planes, count, candidates)):
+                entry = self.entries[entry_id]
+                if entry in seen:
+                    continue
+                seen.add(entry)
+                dataset_name, row = entry
+                hits.append((dataset_name, self.datasets[dataset_name][row], count / len(grams)))
+                if len(hits) >= limit:
+                    return hits
+        return hits
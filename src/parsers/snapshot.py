@@ -0,0 +1,44 @@
+import hashlib
+import mmap
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+SNAPSHOT_SUFFIX = ".snapshot"
+
+class SnapshotError(Exception):
+    pass
+
+def descriptor_digest(descriptor_file: Path) -> str:
+    with open(descriptor_file, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+def snapshot_path(snapshot_dir: Path, descriptor_file: Path, digest: str, parser_version: int) -> Path:
+    return snapshot_dir / f"{descriptor_file.stem}-{digest}-v{parser_version}{SNAPSHOT_SUFFIX}"
+
+def read_snapshot(path: Path, digest: str, parser_version: int) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            payload = pickle.loads(mapped)
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as e:
+        raise SnapshotError(f"Could not read snapshot {path}: {e}") from e
+    
+    if not isinstance(payload, dict) or payload.get("digest") != digest or payload.get("parser_version") != parser_version:
+        raise SnapshotError(f"Snapshot {path} does not match descriptor digest or parser version")
+    return payload
+
+def write_snapshot(path: Path, payload: Dict[str, Any]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,52 @@
+import threading
+from typing import Dict, List, Optional, Tuple
+from src.parsers.ue_struct import class_name_from_path
+
+class SymbolTable:
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._ids_by_short_name: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+        self.paths: List[str] = []
+        self.short_names: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def __getstate__(self):
+        return {"paths": self.paths, "short_names": self.short_names}
+    
+    def __setstate__(self, state):
+        self.__init__()
+        for path, short_name in zip(state["paths"], state["short_names"]):
+            self._add(path, short_name)
+    
+    def _add(self, path: str, short_name: str) -> int:
+        symbol_id = len(self.paths)
+        self.paths.append(path)
+        self.short_names.append(short_name)
+        self._ids[path] = symbol_id
+        self._ids_by_short_name.setdefault(short_name, []).append(symbol_id)
+        return symbol_id
+    
+    def intern(self, path: str) -> int:
+        symbol_id = self._ids.get(path)
+        if symbol_id is not None:
+            return symbol_id
+        with self._lock:
+            symbol_id = self._ids.get(path)
+            if symbol_id is None:
+                symbol_id = self._add(path, class_name_from_path(path))
+            return symbol_id
+    
+    def id_of(self, path: str) -> Optional[int]:
+        return self._ids.get(path)
+    
+    def ids_of_short_name(self, short_name: str) -> Tuple[int, ...]:
+        return tuple(self._ids_by_short_name.get(short_name, ()))
+    
+    def path(self, symbol_id: int) -> str:
+        return self.paths[symbol_id]
+    
+    def short_name(self, symbol_id: int) -> str:
+        return self.short_names[symbol_id]
@@ -0,0 +1,43 @@
+from typing import Dict, List, Optional
+from src.parsers.masks import rows_mask, select_rows
+from src.parsers.name_index import NameIndex
+from src.parsers.records import UnlockRecord
+
+class TechTree:
+    def __init__(self, unlocks: List[UnlockRecord]):
+        self.unlocks = unlocks
+        size = len(unlocks)
+        self.all_mask = (1 << size) - 1
+        self.names = NameIndex(unlocks)
+        
+        type_rows: Dict[str, List[int]] = {}
+        tier_rows: Dict[int, List[int]] = {}
+        milestone_rows: Dict[str, List[int]] = {}
+        for row, unlock in enumerate(unlocks):
+            type_rows.setdefault(unlock.unlock_type.lower(), []).append(row)
+            if unlock.tier is not None:
+                tier_rows.setdefault(unlock.tier, []).append(row)
+            if unlock.milestone:
+                milestone_rows.setdefault(unlock.milestone.lower(), []).append(row)
+        
+        self._type_masks = {unlock_type: rows_mask(rows, size) for unlock_type, rows in type_rows.items()}
+        self._tier_masks = {tier: rows_mask(rows, size) for tier, rows in tier_rows.items()}
+        self._milestone_masks = {milestone: rows_mask(rows, size) for milestone, rows in milestone_rows.items()}
+    
+    def filter(
+        self,
+        unlock_type: Optional[str] = None,
+        tier: Optional[int] = None,
+        milestone: Optional[str] = None
+    ) -> List[UnlockRecord]:
+        mask = self.all_mask
+        if unlock_type:
+            mask &= self._type_masks.get(unlock_type.lower(), 0)
+        if tier is not None:
+            mask &= self._tier_masks.get(tier, 0)
+        if milestone:
+            mask &= self._milestone_masks.get(milestone.lower(), 0)
+        return select_rows(self.unlocks, mask)
+    
+    def find(self, name: str) -> Optional[UnlockRecord]:
+        return self.names.find(name)
@@ -0,0 +1,163 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Pattern, Tuple, Union
+
+UEValue = Union[str, Tuple[Any, ...], Dict[str, Any]]
+
+class ItemAmount(NamedTuple):
+    item_class: str
+    amount: int
+
+_new_tuple = tuple.__new__
+
+_VALUE = r'(?:"[^"]*"|[^(),="\s][^(),="]*)(?:"[^"]*"|[^(),="]+)*'
+_TOKEN_PATTERN = re.compile(rf'\s*(?:(\()|(\))|(,)|(=)|({_VALUE}))')
+_FIELD_VALUE = r'(?:"([^"]*)"|([^(),="\s]+(?:"[^"]*"[^(),="\s]*)*))'
+_FIELD_INTEGER = r'(-?\d+)(?:\.\d*)?'
+_FLAT_ELEMENT_PATTERN = re.compile(rf'[(,]\s*{_FIELD_VALUE}\s*(?=[,)])')
+
+def compile_struct_pattern(**field_patterns: str) -> Pattern:
+    fields = r"\s*,\s*".join(rf"{re.escape(name)}\s*=\s*{pattern}" for name, pattern in field_patterns.items())
+    return re.compile(rf"\(\s*{fields}\s*\)")
+
+_ITEM_AMOUNT_PATTERN = compile_struct_pattern(ItemClass=_FIELD_VALUE, Amount=_FIELD_INTEGER)
+
+class UEStructSyntaxError(ValueError):
+    pass
+
+def _unquote(value: str) -> str:
+    if value[-1].isspace():
+        value = value.rstrip()
+    if value[0] == '"' and value[-1] == '"' and value.count('"') == 2:
+        return value[1:-1]
+    return value
+
+def _close_group(positional: List[UEValue], fields: Dict[str, UEValue]) -> UEValue:
+    if fields:
+        if positional:
+            raise UEStructSyntaxError("Cannot mix named and positional struct members")
+        return fields
+    return tuple(positional)
+
+@lru_cache(maxsize=4096)
+def parse_struct(text: str) -> UEValue:
+    if text.count('"') % 2:
+        raise UEStructSyntaxError(f"Unbalanced quotes in struct: {text[:40]!r}")
+    
+    stack = []
+    positional: List[UEValue] = []
+    fields: Dict[str, UEValue] = {}
+    key = None
+    element = None
+    has_element = False
+    
+    for open_group, close_group, separator, assign, value in _TOKEN_PATTERN.findall(text):
+        if value:
+            if has_element:
+                raise UEStructSyntaxError(f"Unexpected value {value!r}")
+            element = _unquote(value)
+            has_element = True
+        elif assign:
+            if not has_element or key is not None or not isinstance(element, str):
+                raise UEStructSyntaxError("Unexpected '='")
+            key = element
+            has_element = False
+        elif open_group:
+            if has_element:
+                raise UEStructSyntaxError("Unexpected '('")
+            stack.append((positional, fields, key))
+            positional, fields, key = [], {}, None
+        else:
+            if not stack:
+                raise UEStructSyntaxError(f"Unexpected {close_group or separator!r}")
+            if has_element:
+                if key is None:
+                    positional.append(element)
+                else:
+                    fields[key] = element
+            elif key is not None:
+                raise UEStructSyntaxError(f"Missing value for {key!r}")
+            key = None
+            has_element = False
+            if close_group:
+                element = _close_group(positional, fields)
+                has_element = True
+                positional, fields, key = stack.pop()
+    
+    if stack:
+        raise UEStructSyntaxError(f"Unterminated struct: {text[:40]!r}")
+    return element if has_element else ()
+
+def _as_tuple(value: Optional[UEValue]) -> Tuple[Any, ...]:
+    if isinstance(value, tuple):
+        return value
+    if value is None or value == "":
+        return ()
+    return (value,)
+
+def strip_object_path(path: str) -> str:
+    if "'" not in path and '"' not in path:
+        return path
+    path = path.strip().strip('"')
+    quote = path.find("'")
+    if quote != -1 and path.endswith("'"):
+        path = path[quote + 1:-1]
+    return path.strip('"')
+
+def class_name_from_path(path: str) -> str:
+    object_name = strip_object_path(path).rsplit("/", 1)[-1]
+    return object_name.rsplit(".", 1)[-1]
+
+def asset_name_from_path(path: str) -> str:
+    object_name = strip_object_path(path).rsplit("/", 1)[-1]
+    return object_name.split(".", 1)[0]
+
+def _parse_or_empty(text: str) -> Optional[UEValue]:
+    try:
+        return parse_struct(text)
+    except UEStructSyntaxError:
+        return None
+
+def _to_amount(value: Any) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+@lru_cache(maxsize=4096)
+def parse_item_amounts(text: str) -> Tuple[ItemAmount, ...]:
+    if not text:
+        return ()
+    matches = _ITEM_AMOUNT_PATTERN.findall(text)
+    if len(matches) == text.count("ItemClass"):
+        return tuple([_new_tuple(ItemAmount, (quoted or bare, int(amount))) for quoted, bare, amount in matches])
+    
+    items = []
+    for entry in _as_tuple(_parse_or_empty(text)):
+        if isinstance(entry, dict) and "ItemClass" in entry and "Amount" in entry:
+            items.append(ItemAmount(entry["ItemClass"], _to_amount(entry["Amount"])))
+    return tuple(items)
+
+@lru_cache(maxsize=4096)
+def parse_object_paths(text: str) -> Tuple[str, ...]:
+    if not text:
+        return ()
+    if text.count("(") == 1 and text.lstrip().startswith("(") and text.rstrip().endswith(")"):
+        matches = _FLAT_ELEMENT_PATTERN.findall(text)
+        if len(matches) == text.count(",") + 1:
+            return tuple([quoted or bare for quoted, bare in matches])
+    return tuple(entry for entry in _as_tuple(_parse_or_empty(text)) if isinstance(entry, str))
+
+def parse_named_floats(text: str) -> Dict[str, float]:
+    if not text:
+        return {}
+    value = _parse_or_empty(text)
+    if not isinstance(value, dict):
+        return {}
+    result = {}
+    for key, raw in value.items():
+        try:
+            result[key] = float(raw)
+        except (TypeError, ValueError):
+            continue
+    return result
@@ -0,0 +1,93 @@
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+CLASS_SUFFIX = "_C"
+
+UnlockInfo = Dict[str, Optional[Any]]
+
+NO_UNLOCK: UnlockInfo = {"tier": None, "milestone": None, "unlock_type": None}
+
+class UnlockIndex:
+    def __init__(self):
+        self.by_class: Dict[str, UnlockInfo] = {}
+        self.by_milestone: Dict[str, List[str]] = {}
+        self._resolved: Dict[str, UnlockInfo] = {}
+        self._keys: List[str] = []
+        self._order: Dict[str, int] = {}
+        self._unsuffixed: List[int] = []
+        self._key_lengths: Set[int] = set()
+        self._substrings: Optional[Dict[str, int]] = None
+    
+    def __contains__(self, class_name: str) -> bool:
+        return class_name in self.by_class
+    
+    def __getitem__(self, class_name: str) -> UnlockInfo:
+        return self.by_class[class_name]
+    
+    def __len__(self) -> int:
+        return len(self.by_class)
+    
+    def items(self) -> Iterator[Tuple[str, UnlockInfo]]:
+        return iter(self.by_class.items())
+    
+    def add(self, class_name: str, tier: Optional[int], milestone: Optional[str], unlock_type: str):
+        if class_name in self.by_class:
+            return
+        self.by_class[class_name] = {"tier": tier, "milestone": milestone, "unlock_type": unlock_type}
+        self._order[class_name] = len(self._keys)
+        self._keys.append(class_name)
+        if class_name.endswith(CLASS_SUFFIX):
+            self._key_lengths.add(len(class_name))
+        else:
+            self._unsuffixed.append(self._order[class_name])
+        self._substrings = None
+        if milestone:
+            self.by_milestone.setdefault(milestone, []).append(class_name)
+    
+    def classes_unlocked_by(self, milestone: str) -> List[str]:
+        return list(self.by_milestone.get(milestone, ()))
+    
+    def _substring_index(self) -> Dict[str, int]:
+        if self._substrings is None:
+            substrings = {}
+            for order, class_name in enumerate(self._keys):
+                for end in _suffix_ends(class_name):
+                    for start in range(end - len(CLASS_SUFFIX) + 1):
+                        substrings.setdefault(class_name[start:end], order)
+            self._substrings = substrings
+        return self._substrings
+    
+    def first_overlapping(self, class_name: str) -> Optional[UnlockInfo]:
+        if not class_name.endswith(CLASS_SUFFIX):
+            for key, value in self.by_class.items():
+                if class_name in key or key in class_name:
+                    return value
+            return None
+        
+        best = self._substring_index().get(class_name, len(self._keys))
+        for end in _suffix_ends(class_name):
+            for length in self._key_lengths:
+                if length <= end:
+                    order = self._order.get(class_name[end - length:end])
+                    if order is not None and order < best:
+                        best = order
+        for order in self._unsuffixed:
+            if order >= best:
+                break
+            if self._keys[order] in class_name:
+                best = order
+                break
+        
+        return self.by_class[self._keys[best]] if best < len(self._keys) else None
+    
+    def resolved(self, class_name: str) -> Optional[UnlockInfo]:
+        return self._resolved.get(class_name)
+    
+    def remember(self, class_name: str, info: UnlockInfo) -> UnlockInfo:
+        self._resolved[class_name] = info
+        return info
+
+def _suffix_ends(class_name: str) -> Iterator[int]:
+    end = class_name.find(CLASS_SUFFIX)
+    while end != -1:
+        yield end + len(CLASS_SUFFIX)
+        end = class_name.find(CLASS_SUFFIX, end + 1)
@@ -1,95 +1,46 @@
 from typing import Dict, List, Optional, Tuple
 from src.parsers.game_descriptor_parser import GameDescriptorParser
+from src.parsers.recipe_table import RecipeTable
 
 class SatisfactoryCalculator:
     def __init__(self, parser: GameDescriptorParser):
         self.parser = parser
-        self._recipes_cache = None
-        self._items_cache = None
+        self._clear_caches()
+    
+    def _clear_caches(self):
+        self._revision = self.parser.revision
         self._buildings_cache = None
     
-    def _get_recipes(self):
-        if self._recipes_cache is None:
-            self._recipes_cache = self.parser.extract_recipes()
-        return self._recipes_cache
+    def _check_revision(self):
+        if self._revision != self.parser.revision:
+            self._clear_caches()
     
-    def _get_items(self):
-        if self._items_cache is None:
-            self._items_cache = self.parser.extract_all_items()
-        return self._items_cache
+    def _get_recipe_table(self) -> RecipeTable:
+        self._check_revision()
+        return self.parser.recipe_table()
     
     def _get_buildings(self):
+        self._check_revision()
         if self._buildings_cache is None:
             self._buildings_cache = self.parser.extract_buildings()
         return self._buildings_cache
     
     def _find_item_by_name(self, item_name: str):
-        items = self._get_items()
-        for item in items:
-            if item["class_name"] == item_name or item["display_name"].lower() == item_name.lower():
-                return item
-        return None
+        return self.parser.name_index("items").find(item_name)
     
     def _find_recipe_by_product(self, item_class_or_name: str, include_alternates: bool = True):
-        recipes = self._get_recipes()
-        matching = []
+        recipe_table = self._get_recipe_table()
         
         item_obj = self._find_item_by_name(item_class_or_name)
-        if item_obj:
-            item_class = item_obj["class_name"]
-            item_display_name = item_obj["display_name"]
-        else:
-            item_class = item_class_or_name
-            item_display_name = None
+        item_class = item_obj["class_name"] if item_obj else item_class_or_name
         
-        for recipe in recipes:
-            if not include_alternates and recipe.get("is_alternate", False):
-                continue
-            for product in recipe.get("products", []):
-                product_class = product["item_class"]
-                product_class_short = self._extract_class_name_from_path(product_class)
-                
-                match = False
-                if item_obj:
-                    item_name_short = item_class.replace("Desc_", "").replace("_C", "")
-                    product_name_short = product_class_short.replace("Desc_", "").replace("_C", "") if product_class_short else ""
-                    
-                    if (product_class_short and product_class_short == item_class):
-                        match = True
-                    elif item_name_short in product_class:
-                        match = True
-                    elif product_name_short and product_name_short == item_name_short:
-                        match = True
-                    elif item_display_name and (recipe["display_name"] == item_display_name or 
-                        recipe["display_name"].startswith(item_display_name + " ") or
-                        recipe["display_name"].startswith("Alternate: " + item_display_name)):
-                        match = True
-                else:
-                    if (product_class == item_class or 
-                        product_class_short == item_class or
-                        item_class in product_class):
-                        match = True
-                
-                if match:
-                    matching.append(recipe)
-                    break
-        return matching
-    
-    def _extract_class_name_from_path(self, item_class_path: str) -> str:
-        if "/Desc_" in item_class_path:
-            parts = item_class_path.split("/Desc_")
-            if len(parts) > 1:
-                class_part = parts[-1].split(".")[0]
-                return f"Desc_{class_part}_C"
-        return item_class_path
+        mask = self.parser.item_usage().produced_by(item_class)
+        if not include_alternates:
+            mask &= recipe_table.alternate(False)
+        return recipe_table.select(mask)
     
     def calculate_production_rate(self, recipe_name: str, building_name: Optional[str] = None, overclock_percentage: float = 100.0) -> Dict:
-        recipes = self._get_recipes()
-        recipe = None
-        for r in recipes:
-            if r["class_name"] == recipe_name or r["display_name"].lower() == recipe_name.lower():
-                recipe = r
-                break
+        recipe = self._get_recipe_table().find(recipe_name)
         
         if not recipe:
             return {"error": f"Recipe '{recipe_name}' not found"}